@@ -2,39 +2,40 @@ from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.responses import HTMLResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy import text
-from sqlalchemy.orm import Session
-from .database import get_db
+from .responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 import backend.app.routers.auth as auth_module
 import backend.app.routers.motors as motors_module
 import backend.app.routers.users as users_module
-from .database import engine, SessionLocal
+from .routers.auth.router import ADMIN_PASSWORD, hash_password
+from .database import engine, SessionLocal, AsyncSessionLocal
 from shared.models import Base, User
 import os
 import sys
-import hashlib
+import gzip
+import time
+from contextlib import asynccontextmanager
 
-# Add shared to path for subprocess
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
+# Resolved once at import; every file path below is built from it
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# Add shared to path for subprocess
+sys.path.insert(0, os.path.join(BASE_DIR, '..', '..', 'shared'))
 
 # Initialize default admin user
 def init_default_admin():
     db = SessionLocal()
     try:
         default_admin = os.getenv("DEFAULT_ADMIN_USERNAME", "admin")
-        admin_password = os.getenv("ADMIN_PASSWORD", "admin_default")
         
         # Check if admin exists
         existing_admin = db.query(User).filter(User.username == default_admin).first()
         if not existing_admin:
-            password_hash = hashlib.sha256(admin_password.encode()).hexdigest()
             admin_user = User(
                 username=default_admin,
-                password_hash=password_hash,
+                password_hash=hash_password(ADMIN_PASSWORD),
                 role="admin",
                 protected=True
             )
@@ -49,9 +50,15 @@ def init_default_admin():
     finally:
         db.close()
 
-init_default_admin()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create tables and bootstrap the admin user at server startup rather
+    # than at import time
+    Base.metadata.create_all(bind=engine)
+    init_default_admin()
+    yield
 
-app = FastAPI(title="Motor Dynamometer API", version="1.0.0")
+app = FastAPI(title="Motor Dynamometer API", version="1.0.0", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Middleware to add refreshed token to response headers
 class TokenRefreshMiddleware(BaseHTTPMiddleware):
@@ -64,67 +71,100 @@ class TokenRefreshMiddleware(BaseHTTPMiddleware):
 
 app.add_middleware(TokenRefreshMiddleware)
 
-# CORS for web app
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict to your domain
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-    expose_headers=["X-New-Token"],  # Allow frontend to read the new token header
-)
+# CORS is only needed for browser apps on other origins. The web UI is served
+# by this app and the dyno station isn't a browser, so the middleware is only
+# installed when CORS_ORIGINS lists allowed origins (comma-separated).
+cors_origins = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin.strip()]
+if cors_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        # Allow frontends to read the refreshed token and the listing page cursor
+        expose_headers=["X-New-Token", "X-Next-Before", "X-Next-Before-Id"],
+    )
+
+# Compress JSON responses; responses that already set Content-Encoding
+# (the pre-compressed pages below) pass through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 app.include_router(auth_module.router, prefix="/auth", tags=["auth"])
 app.include_router(motors_module.router, prefix="/motors", tags=["motors"])
 app.include_router(users_module.router, prefix="/users", tags=["users"])
 
 # Mount static files directory
-static_dir = os.path.join(os.path.dirname(__file__), "static")
+static_dir = os.path.join(BASE_DIR, "static")
 os.makedirs(static_dir, exist_ok=True)
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
+# Page templates are static HTML, so read them once at startup and keep the
+# raw UTF-8 bytes; HTMLResponse sends bytes as-is without re-encoding.
+# A gzipped copy is kept too so pages are never recompressed per request.
+template_dir = os.path.join(BASE_DIR, "templates")
+TEMPLATES: dict[str, bytes] = {}
+GZIPPED_TEMPLATES: dict[str, bytes] = {}
+for name in ("landing.html", "motors.html", "motor_detail.html", "users.html", "login.html"):
+    with open(os.path.join(template_dir, name), "rb") as f:
+        TEMPLATES[name] = f.read()
+    GZIPPED_TEMPLATES[name] = gzip.compress(TEMPLATES[name], compresslevel=9)
+
+def page_response(request: Request, name: str) -> HTMLResponse:
+    """Return a cached page, pre-compressed when the client accepts gzip"""
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return HTMLResponse(
+            GZIPPED_TEMPLATES[name],
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return HTMLResponse(TEMPLATES[name], headers={"Vary": "Accept-Encoding"})
+
+# A successful DB check is reused for this long so frequent probes don't
+# each take a pooled connection
+HEALTH_CACHE_SECONDS = 1.0
+_last_healthy = 0.0
+
 @app.get("/health")
-def health_check(db: Session = Depends(get_db)):
+async def health_check():
+    global _last_healthy
+    now = time.monotonic()
+    if now - _last_healthy < HEALTH_CACHE_SECONDS:
+        return {"status": "healthy", "database": "connected"}
     try:
         # Simple query to test DB connection
-        db.execute(text("SELECT 1"))
+        async with AsyncSessionLocal() as db:
+            await db.execute(text("SELECT 1"))
+        _last_healthy = now
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
+        _last_healthy = 0.0
         raise HTTPException(status_code=500, detail=f"Database connection failed: {str(e)}")
 
+# Empty response to suppress Chrome DevTools 404 warnings; it carries no
+# per-request state, so one instance is shared
+DEVTOOLS_NO_CONTENT = Response(status_code=204)
+
 @app.get("/.well-known/appspecific/com.chrome.devtools.json")
 def chrome_devtools_config():
-    # Return empty response to suppress Chrome DevTools 404 warnings
-    from fastapi.responses import Response
-    return Response(status_code=204)
+    return DEVTOOLS_NO_CONTENT
 
 @app.get("/", response_class=HTMLResponse)
-def read_root():
+def read_root(request: Request):
     # Check if user is logged in by serving landing page or redirecting
-    template_path = os.path.join(os.path.dirname(__file__), "templates", "landing.html")
-    with open(template_path, "r", encoding="utf-8") as f:
-        return f.read()
+    return page_response(request, "landing.html")
 
 @app.get("/motors-page", response_class=HTMLResponse)
-def motors_page():
-    template_path = os.path.join(os.path.dirname(__file__), "templates", "motors.html")
-    with open(template_path, "r", encoding="utf-8") as f:
-        return f.read()
+def motors_page(request: Request):
+    return page_response(request, "motors.html")
 
 @app.get("/motor/{motor_id}", response_class=HTMLResponse)
-def motor_detail_page(motor_id: str):
-    template_path = os.path.join(os.path.dirname(__file__), "templates", "motor_detail.html")
-    with open(template_path, "r", encoding="utf-8") as f:
-        return f.read()
+def motor_detail_page(motor_id: str, request: Request):
+    return page_response(request, "motor_detail.html")
 
 @app.get("/manage-users", response_class=HTMLResponse)
-def manage_users_page():
-    template_path = os.path.join(os.path.dirname(__file__), "templates", "users.html")
-    with open(template_path, "r", encoding="utf-8") as f:
-        return f.read()
+def manage_users_page(request: Request):
+    return page_response(request, "users.html")
 
 @app.get("/login-page", response_class=HTMLResponse)
-def login_page():
-    template_path = os.path.join(os.path.dirname(__file__), "templates", "login.html")
-    with open(template_path, "r", encoding="utf-8") as f:
-        return f.read()
\ No newline at end of file
+def login_page(request: Request):
+    return page_response(request, "login.html")
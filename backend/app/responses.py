@@ -0,0 +1,13 @@
+from fastapi.responses import JSONResponse
+import orjson
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    asyncpg returns its own uuid.UUID subclass, which orjson does not encode
+    natively, so anything orjson can't handle falls back to str().
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
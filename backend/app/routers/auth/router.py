@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from ...database import get_db
 import shared.models
@@ -7,6 +9,8 @@ from shared.models import User
 import os
 import hashlib
 import time
+import jwt
+from argon2 import PasswordHasher
 
 router = APIRouter()
 security = HTTPBearer()
@@ -14,15 +18,26 @@ security = HTTPBearer()
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin_default")
 USER_PASSWORD = os.getenv("USER_PASSWORD", "user_default")
 TOKEN_EXPIRY_HOURS = 2
+TOKEN_EXPIRY_SECONDS = TOKEN_EXPIRY_HOURS * 3600
+
+ROLE_PASSWORDS = {"admin": ADMIN_PASSWORD, "user": USER_PASSWORD}
+
+# Stored password hashes use argon2id with a random salt per user
+PASSWORD_HASHER = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
 
 def hash_password(password: str) -> str:
-    return hashlib.sha256(password.encode()).hexdigest()
+    return PASSWORD_HASHER.hash(password)
+
+# HS256 signing key for auth tokens. Without an explicit TOKEN_SECRET it is
+# derived from the shared passwords, so every worker agrees on it and
+# changing a password still invalidates outstanding tokens.
+TOKEN_SECRET = os.getenv("TOKEN_SECRET") or hashlib.sha256(f"{ADMIN_PASSWORD}:{USER_PASSWORD}".encode()).hexdigest()
+TOKEN_ALGORITHM = "HS256"
 
-def generate_token(user_id: str, role: str, password: str) -> str:
-    """Generate a token with user_id, role, timestamp, and password hash"""
-    timestamp = int(time.time())
-    token_hash = hash_password(password)
-    return f"{user_id}:{role}:{timestamp}:{token_hash}"
+def generate_token(user_id: str, role: str) -> str:
+    """Generate a signed JWT carrying user_id, role and expiry"""
+    payload = {"sub": user_id, "role": role, "exp": int(time.time()) + TOKEN_EXPIRY_SECONDS}
+    return jwt.encode(payload, TOKEN_SECRET, algorithm=TOKEN_ALGORITHM)
 
 @router.post("/login")
 def login(username: str, password: str, db: Session = Depends(get_db)):
@@ -35,69 +50,50 @@ def login(username: str, password: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     # Find or create user with the appropriate role
-    user = db.query(User).filter(User.username == username).first()
-    if not user:
-        user = User(
-            username=username, 
-            password_hash=hash_password(password),
-            role=role
+    user_id = db.scalar(select(User.id).filter(User.username == username))
+    if user_id is None:
+        # Single INSERT ... RETURNING; ON CONFLICT covers a concurrent first
+        # login of the same username
+        user_id = db.scalar(
+            insert(User)
+            .values(username=username, password_hash=hash_password(password), role=role)
+            .on_conflict_do_nothing(index_elements=[User.username])
+            .returning(User.id)
         )
-        db.add(user)
         db.commit()
-        db.refresh(user)
+        if user_id is None:
+            user_id = db.scalar(select(User.id).filter(User.username == username))
     
     # Return token with role and timestamp
-    token = generate_token(str(user.id), role, password)
+    token = generate_token(str(user_id), role)
     return {
         "token": token, 
-        "user_id": str(user.id),
-        "username": user.username,
+        "user_id": str(user_id),
+        "username": username,
         "role": role
     }
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    from fastapi import Request
-    from starlette.requests import Request as StarletteRequest
-    
-    token = credentials.credentials
     try:
-        user_id, role, timestamp, token_hash = token.split(":")
-        
-        # Check if token has expired (2 hours)
-        current_time = int(time.time())
-        token_age = current_time - int(timestamp)
-        expiry_seconds = TOKEN_EXPIRY_HOURS * 3600
-        
-        if token_age > expiry_seconds:
-            raise HTTPException(status_code=401, detail="Token expired. Please login again.")
-        
-        # Verify token hash matches one of the passwords
-        if token_hash != hash_password(ADMIN_PASSWORD) and token_hash != hash_password(USER_PASSWORD):
-            raise HTTPException(status_code=401, detail="Invalid token")
-        
-        # Generate a new token with refreshed timestamp for activity-based renewal
-        # Determine which password to use based on which hash matched
-        if token_hash == hash_password(ADMIN_PASSWORD):
-            new_token = generate_token(user_id, role, ADMIN_PASSWORD)
-        else:
-            new_token = generate_token(user_id, role, USER_PASSWORD)
-        
-        return {"user_id": user_id, "role": role, "new_token": new_token}
-    except ValueError:
-        raise HTTPException(status_code=401, detail="Invalid token format")
-    except HTTPException:
-        raise
-    except:
+        claims = jwt.decode(
+            credentials.credentials,
+            TOKEN_SECRET,
+            algorithms=[TOKEN_ALGORITHM],
+            options={"require": ["exp", "sub", "role"]},
+        )
+    except jwt.ExpiredSignatureError:
+        raise HTTPException(status_code=401, detail="Token expired. Please login again.")
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    user_id, role = claims["sub"], claims["role"]
+    
+    # Generate a new token with refreshed expiry for activity-based renewal
+    new_token = generate_token(user_id, role)
+    
+    return {"user_id": user_id, "role": role, "new_token": new_token}
 
 def verify_admin_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     token_data = verify_token(credentials)
     if token_data["role"] != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     return token_data
-
-def verify_admin_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    token_data = verify_token(credentials)
-    if token_data["role"] != "admin":
-        raise HTTPException(status_code=403, detail="Admin access required")
-    return token_data
\ No newline at end of file
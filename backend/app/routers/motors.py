@@ -1,169 +1,314 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from sqlalchemy.orm import Session
-from ..database import get_db
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request, Query, Path as PathParam
+from typing import Annotated, Optional
+from fastapi.responses import FileResponse
+from sqlalchemy import select, update, func, cast, Integer, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_async_db
+from ..responses import ORJSONResponse
+from ..routing import GzipRoute
 from .auth import verify_token, verify_admin_token
-from ..models import Motor, MotorCreate, MotorUpdate, MotorLog, MotorLogCreate, PerformanceTestCreate, PerformanceTest
-from shared.models import Motor as DBMotor, MotorLog as DBMotorLog, PerformanceTest as DBPerformanceTest
+from ..models import Motor, MotorCreate, MotorUpdate, MotorLog, MotorLogCreate, PerformanceTestCreate, PerformanceTest, TestDataPoint
+from shared.models import Motor as DBMotor, MotorLog as DBMotorLog, PerformanceTest as DBPerformanceTest, MotorIdSequence, pooled_uuid4
 from datetime import datetime
 import uuid
-import os
-import shutil
-import json
+import time
+import orjson
+import aiofiles
+import anyio
 import gzip
 from pathlib import Path
 
-router = APIRouter()
+router = APIRouter(route_class=GzipRoute)
 
 # Directory for storing uploaded files
 UPLOAD_DIR = Path("backend/app/static/uploads/motors")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+TEST_DATA_DIR = Path("backend/app/static/uploads/test_data")
+TEST_DATA_DIR.mkdir(parents=True, exist_ok=True)
+MAX_PICTURE_BYTES = 10 * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 1 << 20
+# Human-readable motor ID (yyyy-nnn) used by the test data endpoints;
+# anything else is rejected with a 422 before touching the database
+MotorCode = Annotated[str, PathParam(pattern=r"^\d{4}-\d{3,}$")]
+# Allowed picture types by file signature, and the extension each is saved with
+PICTURE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+)
 
-def generate_motor_id(db: Session) -> str:
+def picture_extension(head: bytes) -> Optional[str]:
+    """Extension for an allowed image type, judged from the file's leading bytes"""
+    for signature, extension in PICTURE_SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+async def generate_motor_id(db: AsyncSession) -> str:
     """Generate motor ID in format yyyy-nnn"""
     current_year = datetime.now().year
     
-    # Find the highest sequence number for this year
-    motors_this_year = db.query(DBMotor).filter(
-        DBMotor.motor_id.like(f"{current_year}-%")
-    ).all()
+    # Bump this year's sequence row; the row lock is held until the caller
+    # commits, so concurrent creates can't hand out the same number
+    sequence = await db.scalar(
+        update(MotorIdSequence)
+        .where(MotorIdSequence.year == current_year)
+        .values(last_seq=MotorIdSequence.last_seq + 1)
+        .returning(MotorIdSequence.last_seq)
+    )
     
-    if not motors_this_year:
-        sequence = 1
-    else:
-        sequences = [int(m.motor_id.split('-')[1]) for m in motors_this_year if m.motor_id]
-        sequence = max(sequences) + 1
+    if sequence is None:
+        # No row for this year yet: seed it from the highest existing ID
+        # ("yyyy-nnn" -> nnn starts at character 6)
+        max_sequence = await db.scalar(
+            select(func.max(cast(func.substr(DBMotor.motor_id, 6), Integer)))
+            .filter(DBMotor.motor_id.like(f"{current_year}-%"))
+        )
+        sequence = await db.scalar(
+            insert(MotorIdSequence)
+            .values(year=current_year, last_seq=(max_sequence or 0) + 1)
+            .on_conflict_do_update(
+                index_elements=[MotorIdSequence.year],
+                set_={"last_seq": MotorIdSequence.last_seq + 1},
+            )
+            .returning(MotorIdSequence.last_seq)
+        )
     
     return f"{current_year}-{sequence:03d}"
 
-@router.get("/", response_model=list[Motor])
-def get_motors(db: Session = Depends(get_db), token_data: dict = Depends(verify_token)):
-    motors = db.query(DBMotor).all()
-    return motors
+# Columns backing the response schemas. Hot GET endpoints select just these
+# and turn the rows straight into dicts instead of loading full ORM objects
+# and validating them through Pydantic
+MOTOR_COLUMNS = tuple(getattr(DBMotor, field) for field in Motor.model_fields)
+MOTOR_LOG_COLUMNS = tuple(getattr(DBMotorLog, field) for field in MotorLog.model_fields)
+PERFORMANCE_TEST_COLUMNS = tuple(getattr(DBPerformanceTest, field) for field in PerformanceTest.model_fields)
+
+# motor_id (yyyy-nnn) -> (primary key, time cached). A motor's yyyy-nnn ID
+# never changes once assigned, so entries only go stale when it is deleted.
+# The cache is per worker process and a delete only evicts it in the worker
+# that handled it, so write paths look the motor up fresh
+MOTOR_PK_CACHE_SECONDS = 60.0
+_motor_pk_cache: dict[str, tuple[uuid.UUID, float]] = {}
+
+async def resolve_motor_pk(db: AsyncSession, motor_id: str, use_cache: bool = True) -> uuid.UUID:
+    """Primary key for a yyyy-nnn motor ID, raising 404 if there is no such motor"""
+    cached = _motor_pk_cache.get(motor_id) if use_cache else None
+    if cached and time.monotonic() - cached[1] < MOTOR_PK_CACHE_SECONDS:
+        return cached[0]
+    
+    motor_pk = await db.scalar(select(DBMotor.id).filter(DBMotor.motor_id == motor_id))
+    if motor_pk is None:
+        _motor_pk_cache.pop(motor_id, None)
+        raise HTTPException(status_code=404, detail="Motor not found")
+    _motor_pk_cache[motor_id] = (motor_pk, time.monotonic())
+    return motor_pk
+
+# Log and test listings are newest first. Passing limit returns one page;
+# the X-Next-Before / X-Next-Before-Id headers then hold the cursor for
+# the next page (send them back as before / before_id)
+MAX_PAGE_SIZE = 500
+
+def newest_first_page(query, time_column, id_column, limit, before, before_id):
+    query = query.order_by(time_column.desc(), id_column.desc())
+    if before is not None:
+        if before_id is not None:
+            query = query.filter(tuple_(time_column, id_column) < tuple_(before, before_id))
+        else:
+            query = query.filter(time_column < before)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+def next_page_headers(rows, limit, time_field):
+    if limit is None or len(rows) < limit:
+        return {}
+    last = rows[-1]
+    return {"X-Next-Before": last[time_field].isoformat(), "X-Next-Before-Id": str(last["id"])}
+
+@router.get("/")
+async def get_motors(db: AsyncSession = Depends(get_async_db), token_data: dict = Depends(verify_token)):
+    rows = (await db.execute(select(*MOTOR_COLUMNS))).mappings().all()
+    return ORJSONResponse([dict(row) for row in rows])
 
 @router.post("/", response_model=Motor)
-def create_motor(motor: MotorCreate, db: Session = Depends(get_db), token_data: dict = Depends(verify_token)):
-    # Create motor without motor_id first
-    motor_data = motor.model_dump(exclude_unset=True)
-    db_motor = DBMotor(**motor_data)
+async def create_motor(motor: MotorCreate, db: AsyncSession = Depends(get_async_db), token_data: dict = Depends(verify_token)):
+    # Create motor without motor_id first, copying only the fields the client sent
+    db_motor = DBMotor(**{field: getattr(motor, field) for field in motor.model_fields_set})
     
     # If type is provided, assign motor_id (name is now optional)
     if motor.motor_type:
-        db_motor.motor_id = generate_motor_id(db)
+        db_motor.motor_id = await generate_motor_id(db)
     
     db.add(db_motor)
-    db.commit()
-    db.refresh(db_motor)
+    await db.commit()
+    await db.refresh(db_motor)
     return db_motor
 
-@router.get("/{motor_id}", response_model=Motor)
-def get_motor(motor_id: str, db: Session = Depends(get_db), token_data: dict = Depends(verify_token)):
-    motor = db.query(DBMotor).filter(DBMotor.id == uuid.UUID(motor_id)).first()
+@router.get("/{motor_id}")
+async def get_motor(motor_id: uuid.UUID, db: AsyncSession = Depends(get_async_db), token_data: dict = Depends(verify_token)):
+    motor = (await db.execute(
+        select(*MOTOR_COLUMNS).filter(DBMotor.id == motor_id)
+    )).mappings().first()
     if not motor:
         raise HTTPException(status_code=404, detail="Motor not found")
-    return motor
+    return ORJSONResponse(dict(motor))
 
 @router.put("/{motor_id}", response_model=Motor)
-def update_motor(motor_id: str, motor: MotorUpdate, db: Session = Depends(get_db), token_data: dict = Depends(verify_token)):
-    db_motor = db.query(DBMotor).filter(DBMotor.id == uuid.UUID(motor_id)).first()
+async def update_motor(motor_id: uuid.UUID, motor: MotorUpdate, db: AsyncSession = Depends(get_async_db), token_data: dict = Depends(verify_token)):
+    db_motor = await db.get(DBMotor, motor_id)
     if not db_motor:
         raise HTTPException(status_code=404, detail="Motor not found")
     
-    # Update fields
-    update_data = motor.model_dump(exclude_unset=True)
-    
     # If motor doesn't have ID yet and now has basic info, assign it
     if not db_motor.motor_id and motor.name and motor.motor_type:
-        db_motor.motor_id = generate_motor_id(db)
+        db_motor.motor_id = await generate_motor_id(db)
     
-    for key, value in update_data.items():
-        setattr(db_motor, key, value)
+    # Update only the fields the client sent
+    for field in motor.model_fields_set:
+        setattr(db_motor, field, getattr(motor, field))
     
-    db.commit()
-    db.refresh(db_motor)
+    await db.commit()
+    await db.refresh(db_motor)
     return db_motor
 
 @router.delete("/{motor_id}")
-def delete_motor(motor_id: str, db: Session = Depends(get_db), token_data: dict = Depends(verify_admin_token)):
-    db_motor = db.query(DBMotor).filter(DBMotor.id == uuid.UUID(motor_id)).first()
+async def delete_motor(motor_id: uuid.UUID, db: AsyncSession = Depends(get_async_db), token_data: dict = Depends(verify_admin_token)):
+    db_motor = await db.get(DBMotor, motor_id)
     if not db_motor:
         raise HTTPException(status_code=404, detail="Motor not found")
     
-    db.delete(db_motor)
-    db.commit()
+    await db.delete(db_motor)
+    await db.commit()
+    _motor_pk_cache.pop(db_motor.motor_id, None)
     return {"message": "Motor deleted successfully"}
 
-@router.get("/{motor_id}/logs", response_model=list[MotorLog])
-def get_motor_logs(motor_id: str, db: Session = Depends(get_db), token_data: dict = Depends(verify_token)):
-    logs = db.query(DBMotorLog).filter(
-        DBMotorLog.motor_id == uuid.UUID(motor_id)
-    ).order_by(DBMotorLog.created_at.desc()).all()
-    return logs
+@router.get("/{motor_id}/logs")
+async def get_motor_logs(
+    motor_id: uuid.UUID,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    before: Optional[datetime] = None,
+    before_id: Optional[uuid.UUID] = None,
+    db: AsyncSession = Depends(get_async_db),
+    token_data: dict = Depends(verify_token)
+):
+    query = select(*MOTOR_LOG_COLUMNS).filter(DBMotorLog.motor_id == motor_id)
+    query = newest_first_page(query, DBMotorLog.created_at, DBMotorLog.id, limit, before, before_id)
+    rows = [dict(row) for row in (await db.execute(query)).mappings().all()]
+    return ORJSONResponse(rows, headers=next_page_headers(rows, limit, "created_at"))
 
 @router.post("/{motor_id}/logs", response_model=MotorLog)
-def create_motor_log(motor_id: str, log: MotorLogCreate, db: Session = Depends(get_db), token_data: dict = Depends(verify_token)):
+async def create_motor_log(motor_id: uuid.UUID, log: MotorLogCreate, db: AsyncSession = Depends(get_async_db), token_data: dict = Depends(verify_token)):
     user_id = uuid.UUID(token_data['user_id'])
     
     db_log = DBMotorLog(
-        motor_id=uuid.UUID(motor_id),
+        motor_id=motor_id,
         user_id=user_id,
         entry_text=log.entry_text
     )
     
     db.add(db_log)
-    db.commit()
-    db.refresh(db_log)
+    await db.commit()
+    await db.refresh(db_log)
     return db_log
 
+@router.post("/{motor_id}/logs/batch")
+async def create_motor_logs(motor_id: uuid.UUID, logs: list[MotorLogCreate], db: AsyncSession = Depends(get_async_db), token_data: dict = Depends(verify_token)):
+    if not logs:
+        return ORJSONResponse([])
+    user_id = uuid.UUID(token_data['user_id'])
+    
+    # One multi-row INSERT and one commit for the whole batch
+    rows = (await db.execute(
+        insert(DBMotorLog).returning(*MOTOR_LOG_COLUMNS),
+        [{"motor_id": motor_id, "user_id": user_id, "entry_text": log.entry_text} for log in logs]
+    )).mappings().all()
+    await db.commit()
+    return ORJSONResponse([dict(row) for row in rows])
+
 @router.post("/{motor_id}/upload-picture")
 async def upload_motor_picture(
-    motor_id: str, 
+    motor_id: uuid.UUID, 
     file: UploadFile = File(...),
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_async_db), 
     token_data: dict = Depends(verify_token)
 ):
-    # Validate file type
-    allowed_types = {"image/jpeg", "image/png", "image/gif", "image/webp"}
-    if file.content_type not in allowed_types:
+    if file.size is not None and file.size > MAX_PICTURE_BYTES:
+        raise HTTPException(status_code=413, detail="Picture is too large (10 MB max).")
+    
+    # Validate file type from its contents; neither the client's Content-Type
+    # nor its filename is trusted
+    chunk = await file.read(UPLOAD_CHUNK_BYTES)
+    file_extension = picture_extension(chunk)
+    if file_extension is None:
         raise HTTPException(status_code=400, detail="Invalid file type. Only images are allowed.")
     
     # Get motor
-    db_motor = db.query(DBMotor).filter(DBMotor.id == uuid.UUID(motor_id)).first()
+    db_motor = await db.get(DBMotor, motor_id)
     if not db_motor:
         raise HTTPException(status_code=404, detail="Motor not found")
     
     # Generate unique filename
-    file_extension = file.filename.split(".")[-1]
     unique_filename = f"{motor_id}.{file_extension}"
     file_path = UPLOAD_DIR / unique_filename
     
-    # Save file
-    with file_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # Stream file to disk in chunks without blocking the event loop
+    written = 0
+    async with aiofiles.open(file_path, "wb") as buffer:
+        while chunk:
+            written += len(chunk)
+            if written > MAX_PICTURE_BYTES:
+                break
+            await buffer.write(chunk)
+            chunk = await file.read(UPLOAD_CHUNK_BYTES)
+    if written > MAX_PICTURE_BYTES:
+        file_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=413, detail="Picture is too large (10 MB max).")
     
     # Update motor with picture path
     db_motor.picture_path = f"/static/uploads/motors/{unique_filename}"
-    db.commit()
+    await db.commit()
     
     return {"picture_path": db_motor.picture_path}
 
 
+# Test data files are compressed and decompressed in a worker thread so
+# large tests don't stall the event loop
+def write_test_data_file(data_file_path: Path, test_data: PerformanceTestCreate):
+    test_data_json = test_data.model_dump(mode="json", exclude={"test_uuid", "notes", "data_points"})
+    # Samples are stored column-wise (one list per field) rather than as an
+    # object per sample, so field names aren't repeated for every row
+    test_data_json["data_columns"] = {
+        field: [getattr(point, field) for point in test_data.data_points]
+        for field in TestDataPoint.model_fields
+    }
+    
+    # Level 1 keeps nearly all of the size savings for a fraction of the CPU
+    with gzip.open(data_file_path, 'wb', compresslevel=1) as f:
+        f.write(orjson.dumps(test_data_json))
+
+def read_test_data_file(data_file_path: Path) -> dict:
+    with gzip.open(data_file_path, 'rb') as f:
+        return orjson.loads(f.read())
+
 @router.post("/{motor_id}/tests", response_model=PerformanceTest)
-def upload_test_data(
-    motor_id: str,
+async def upload_test_data(
+    motor_id: MotorCode,
     test_data: PerformanceTestCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_token)
 ):
-    # Verify motor exists
-    db_motor = db.query(DBMotor).filter(DBMotor.motor_id == motor_id).first()
-    if not db_motor:
-        raise HTTPException(status_code=404, detail="Motor not found")
+    # Verify motor exists; uncached so a motor deleted via another worker gives 404, not a foreign key error
+    motor_pk = await resolve_motor_pk(db, motor_id, use_cache=False)
     
     # Check if test_uuid already exists (prevent duplicate uploads)
     if test_data.test_uuid:
-        existing_test = db.query(DBPerformanceTest).filter(
+        existing_test = await db.scalar(select(DBPerformanceTest.id).filter(
             DBPerformanceTest.test_uuid == test_data.test_uuid
-        ).first()
+        ))
         if existing_test:
             raise HTTPException(
                 status_code=409, 
@@ -172,48 +317,18 @@ def upload_test_data(
     
     user_id = uuid.UUID(token_data['user_id'])
     
-    # Create directory for test data if it doesn't exist
-    test_data_dir = Path("backend/app/static/uploads/test_data")
-    test_data_dir.mkdir(parents=True, exist_ok=True)
-    
     # Generate unique filename for the test data
-    test_id = uuid.uuid4()
+    test_id = pooled_uuid4()
     data_filename = f"{motor_id}_{test_id}.json.gz"
-    data_file_path = test_data_dir / data_filename
+    data_file_path = TEST_DATA_DIR / data_filename
     
     # Save test data as compressed JSON
-    test_data_json = {
-        "test_date": test_data.test_date.isoformat(),
-        "max_current": test_data.max_current,
-        "gear_ratio": test_data.gear_ratio,
-        "spool_diameter": test_data.spool_diameter,
-        "weight_lbs": test_data.weight_lbs,
-        "lift_direction_cw": test_data.lift_direction_cw,
-        "max_lift_distance": test_data.max_lift_distance,
-        "distance_lifted": test_data.distance_lifted,
-        "hardware_description": test_data.hardware_description,
-        "data_points": [
-            {
-                "timestamp": dp.timestamp,
-                "voltage": dp.voltage,
-                "bus_voltage": dp.bus_voltage,
-                "current": dp.current,
-                "rpm": dp.rpm,
-                "distance": dp.distance,
-                "input_power": dp.input_power,
-                "output_power": dp.output_power
-            }
-            for dp in test_data.data_points
-        ]
-    }
-    
-    with gzip.open(data_file_path, 'wt', encoding='utf-8') as f:
-        json.dump(test_data_json, f)
+    await anyio.to_thread.run_sync(write_test_data_file, data_file_path, test_data)
     
     # Create database record
     db_test = DBPerformanceTest(
         id=test_id,
-        motor_id=db_motor.id,
+        motor_id=motor_pk,
         user_id=user_id,
         test_uuid=test_data.test_uuid,
         test_date=test_data.test_date,
@@ -227,56 +342,57 @@ def upload_test_data(
     db.add(db_test)
     
     # Update motor's average power values to latest test results
-    if test_data.avg_power_10a is not None:
-        db_motor.avg_power_10a = test_data.avg_power_10a
-    
-    if test_data.avg_power_20a is not None:
-        db_motor.avg_power_20a = test_data.avg_power_20a
-    
-    if test_data.avg_power_40a is not None:
-        db_motor.avg_power_40a = test_data.avg_power_40a
+    latest_power = {
+        field: getattr(test_data, field)
+        for field in ("avg_power_10a", "avg_power_20a", "avg_power_40a")
+        if getattr(test_data, field) is not None
+    }
+    if latest_power:
+        await db.execute(update(DBMotor).where(DBMotor.id == motor_pk).values(**latest_power))
     
-    db.commit()
-    db.refresh(db_test)
+    await db.commit()
+    await db.refresh(db_test)
     
     return db_test
 
 
-@router.get("/{motor_id}/tests", response_model=list[PerformanceTest])
-def get_motor_tests(
-    motor_id: str,
-    db: Session = Depends(get_db),
+@router.get("/{motor_id}/tests")
+async def get_motor_tests(
+    motor_id: MotorCode,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    before: Optional[datetime] = None,
+    before_id: Optional[uuid.UUID] = None,
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_token)
 ):
     # Get motor by motor_id string
-    db_motor = db.query(DBMotor).filter(DBMotor.motor_id == motor_id).first()
-    if not db_motor:
-        raise HTTPException(status_code=404, detail="Motor not found")
+    motor_pk = await resolve_motor_pk(db, motor_id)
     
-    tests = db.query(DBPerformanceTest).filter(
-        DBPerformanceTest.motor_id == db_motor.id
-    ).order_by(DBPerformanceTest.test_date.desc()).all()
+    query = select(*PERFORMANCE_TEST_COLUMNS).filter(DBPerformanceTest.motor_id == motor_pk)
+    query = newest_first_page(
+        query, DBPerformanceTest.test_date, DBPerformanceTest.id, limit, before, before_id
+    )
+    tests = [dict(row) for row in (await db.execute(query)).mappings().all()]
     
-    return tests
+    return ORJSONResponse(tests, headers=next_page_headers(tests, limit, "test_date"))
 
 
 @router.get("/{motor_id}/tests/{test_id}/data")
-def get_test_data(
-    motor_id: str,
-    test_id: str,
-    db: Session = Depends(get_db),
+async def get_test_data(
+    motor_id: MotorCode,
+    test_id: uuid.UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_token)
 ):
     # Get motor by motor_id string
-    db_motor = db.query(DBMotor).filter(DBMotor.motor_id == motor_id).first()
-    if not db_motor:
-        raise HTTPException(status_code=404, detail="Motor not found")
+    motor_pk = await resolve_motor_pk(db, motor_id)
     
     # Verify test exists and belongs to motor
-    db_test = db.query(DBPerformanceTest).filter(
-        DBPerformanceTest.id == uuid.UUID(test_id),
-        DBPerformanceTest.motor_id == db_motor.id
-    ).first()
+    db_test = await db.scalar(select(DBPerformanceTest).filter(
+        DBPerformanceTest.id == test_id,
+        DBPerformanceTest.motor_id == motor_pk
+    ))
     
     if not db_test:
         raise HTTPException(status_code=404, detail="Test not found")
@@ -288,8 +404,15 @@ def get_test_data(
         if not data_file_path.exists():
             raise HTTPException(status_code=404, detail="Test data file not found")
         
-        with gzip.open(data_file_path, 'rt', encoding='utf-8') as f:
-            test_data = json.load(f)
+        # The file already holds the avg_power values, so gzip clients get it as stored
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return FileResponse(
+                data_file_path,
+                media_type="application/json",
+                headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+            )
+        
+        test_data = await anyio.to_thread.run_sync(read_test_data_file, data_file_path)
         
         # Add avg_power values from database
         test_data['avg_power_10a'] = db_test.avg_power_10a
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from ..database import get_db
-from .auth.router import verify_admin_token
+from ..responses import ORJSONResponse
+from .auth.router import verify_admin_token, hash_password, ROLE_PASSWORDS
 from ..models import User as UserSchema
 from shared.models import User as DBUser
 from pydantic import BaseModel
@@ -24,18 +26,21 @@ class UserCreate(BaseModel):
     username: str
     role: str  # "admin" or "user"
 
-@router.get("/", response_model=list[UserResponse])
+@router.get("/")
 def list_users(db: Session = Depends(get_db), token_data: dict = Depends(verify_admin_token)):
-    users = db.query(DBUser).all()
-    return [
-        UserResponse(
-            id=str(user.id),
-            username=user.username,
-            role=user.role,
-            protected=user.protected,
-            created_at=str(user.created_at)
-        ) for user in users
-    ]
+    users = db.execute(
+        select(DBUser.id, DBUser.username, DBUser.role, DBUser.protected, DBUser.created_at)
+    ).all()
+    # Same shape as UserResponse, built directly instead of validated per row
+    return ORJSONResponse([
+        {
+            "id": str(user.id),
+            "username": user.username,
+            "role": user.role,
+            "protected": user.protected,
+            "created_at": str(user.created_at)
+        } for user in users
+    ])
 
 @router.post("/", response_model=UserResponse)
 def create_user(user_data: UserCreate, db: Session = Depends(get_db), token_data: dict = Depends(verify_admin_token)):
@@ -49,14 +54,9 @@ def create_user(user_data: UserCreate, db: Session = Depends(get_db), token_data
         raise HTTPException(status_code=400, detail="Username already exists")
     
     # Create new user
-    import hashlib
-    import os
-    password = os.getenv("ADMIN_PASSWORD") if user_data.role == "admin" else os.getenv("USER_PASSWORD")
-    password_hash = hashlib.sha256(password.encode()).hexdigest()
-    
     new_user = DBUser(
         username=user_data.username,
-        password_hash=password_hash,
+        password_hash=hash_password(ROLE_PASSWORDS[user_data.role]),
         role=user_data.role,
         protected=False
     )
@@ -73,8 +73,8 @@ def create_user(user_data: UserCreate, db: Session = Depends(get_db), token_data
     )
 
 @router.delete("/{user_id}")
-def delete_user(user_id: str, db: Session = Depends(get_db), token_data: dict = Depends(verify_admin_token)):
-    user = db.query(DBUser).filter(DBUser.id == uuid.UUID(user_id)).first()
+def delete_user(user_id: uuid.UUID, db: Session = Depends(get_db), token_data: dict = Depends(verify_admin_token)):
+    user = db.query(DBUser).filter(DBUser.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -0,0 +1,46 @@
+from fastapi import HTTPException, Request
+from fastapi.routing import APIRoute
+import zlib
+
+# Largest request body accepted once a gzip body is decompressed
+MAX_INFLATED_BODY_BYTES = 32 * 1024 * 1024
+
+
+def inflate_body(body: bytes) -> bytes:
+    """Decompress a gzip request body, refusing anything that inflates past the limit"""
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)  # Expect a gzip header
+    try:
+        data = decompressor.decompress(body, MAX_INFLATED_BODY_BYTES + 1)
+    except zlib.error:
+        raise HTTPException(status_code=400, detail="Invalid gzip request body")
+    if len(data) > MAX_INFLATED_BODY_BYTES:
+        raise HTTPException(status_code=413, detail="Request body too large")
+    return data
+
+
+class GzipRequest(Request):
+    """Request whose body is decompressed when it is sent with Content-Encoding: gzip"""
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            encoding = self.headers.get("content-encoding", "identity").lower()
+            if encoding not in ("gzip", "identity"):
+                # Clients fall back to an uncompressed body on 415
+                raise HTTPException(status_code=415, detail=f"Unsupported Content-Encoding: {encoding}")
+            body = await super().body()
+            if encoding == "gzip":
+                body = inflate_body(body)
+            self._body = body
+        return self._body
+
+
+class GzipRoute(APIRoute):
+    """Route that accepts gzip-compressed request bodies, e.g. test uploads from the dyno station"""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def gzip_handler(request: Request):
+            return await handler(GzipRequest(request.scope, request.receive))
+
+        return gzip_handler
@@ -17,5 +17,23 @@ sys.path.insert(0, '.')
 # Set PYTHONPATH for subprocess
 os.environ['PYTHONPATH'] = '.'
 
+# uvloop is not available on Windows (see requirements.txt), so let uvicorn pick
+# there; elsewhere pin the fast event loop and HTTP parser so a missing extra
+# fails loudly instead of silently falling back to asyncio/h11
+if sys.platform == "win32":
+    SERVER_LOOP = SERVER_HTTP = "auto"
+else:
+    SERVER_LOOP, SERVER_HTTP = "uvloop", "httptools"
+
 if __name__ == "__main__":
-    uvicorn.run("backend.app.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # Auto-reload is a development convenience: it adds a file watcher
+    # process and limits the server to one worker, so only use it with APP_ENV=dev
+    uvicorn.run(
+        "backend.app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=os.getenv("APP_ENV") == "dev",
+        loop=SERVER_LOOP,
+        http=SERVER_HTTP,
+        workers=int(os.getenv("WEB_CONCURRENCY", 1)),
+    )
\ No newline at end of file
@@ -1,16 +1,37 @@
 """
 Convert SVG motor icon to ICO format for Windows executable
 """
-from PIL import Image
-import cairosvg
+import hashlib
 import io
+import os
 
-# Convert SVG to PNG in memory
 svg_file = 'motor_icon.svg'
-png_data = cairosvg.svg2png(url=svg_file, output_width=256, output_height=256)
+ico_file = 'motor_icon.ico'
+# SHA-256 of the SVG the current ICO was built from
+hash_file = 'motor_icon.ico.sha256'
 
-# Open PNG data and save as ICO
-img = Image.open(io.BytesIO(png_data))
-img.save('motor_icon.ico', format='ICO', sizes=[(256, 256), (128, 128), (64, 64), (32, 32), (16, 16)])
+with open(svg_file, 'rb') as f:
+    svg_hash = hashlib.sha256(f.read()).hexdigest()
 
-print("✅ motor_icon.ico created successfully!")
+cached_hash = None
+if os.path.exists(ico_file) and os.path.exists(hash_file):
+    with open(hash_file) as f:
+        cached_hash = f.read().strip()
+
+if cached_hash == svg_hash:
+    print("✅ motor_icon.ico is up to date")
+else:
+    # cairosvg and Pillow are only needed (and only imported) when rebuilding
+    from PIL import Image
+    import cairosvg
+
+    # Render the SVG once at high resolution; Pillow downsamples it for each ICO size
+    png_data = cairosvg.svg2png(url=svg_file, output_width=512, output_height=512)
+
+    img = Image.open(io.BytesIO(png_data)).convert('RGBA')
+    img.save(ico_file, format='ICO', sizes=[(256, 256), (128, 128), (64, 64), (32, 32), (16, 16)])
+
+    with open(hash_file, 'w') as f:
+        f.write(svg_hash)
+
+    print("✅ motor_icon.ico created successfully!")
@@ -40,6 +40,9 @@ echo "🔄 Running database migrations..."
 docker-compose exec -T app python scripts/migrate_role_protected.py || true
 docker-compose exec -T app python scripts/migrate_name_optional.py || true
 docker-compose exec -T app python scripts/migrate_add_test_uuid.py || true
+docker-compose exec -T app python scripts/migrate_add_motor_id_index.py || true
+docker-compose exec -T app python scripts/migrate_embed_test_avg_power.py || true
+docker-compose exec -T app python scripts/migrate_add_listing_indexes.py || true
 
 echo ""
 echo "✅ Deployment complete!"
@@ -8,19 +8,128 @@ Windows application for testing motors and uploading results to the Motor Manage
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
+import tkinter.font as tkfont
+import numpy as np
+import bisect
+import gzip
 import json
 import os
+import re
+import threading
+import time
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import date, datetime
+from functools import lru_cache
+from operator import attrgetter
+from urllib.parse import urlencode
 import requests
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is used without it
+    orjson = None
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, ConnectionError
 from motor_test_controller import MotorTestController
 
+# Data point fields kept in the live sample arrays, one row each
+LIVE_FIELDS = ('timestamp', 'current', 'voltage', 'bus_voltage', 'rpm',
+               'input_power', 'output_power', 'distance')
+LIVE_ROWS = {field: row for row, field in enumerate(LIVE_FIELDS)}
+read_live_fields = attrgetter(*LIVE_FIELDS)  # data point -> tuple of its LIVE_FIELDS values
+# Data point fields written to saved CSV files, in column order
+CSV_FIELDS = ('timestamp', 'voltage', 'bus_voltage', 'current', 'rpm', 'input_power', 'output_power')
+read_csv_fields = attrgetter(*CSV_FIELDS)
+LIVE_PREALLOC = 1024  # Samples; doubled whenever a test outgrows it
+LIVE_XLIM_STEP = 10  # Seconds the live time axis grows by once a test runs past it
+GRAPH_SETTINGS_REDRAW_MS = 80  # Quiet period after a line style change before the graph is rebuilt
+LIVE_REDRAW_MS = 50  # At most one live graph redraw per 50 ms (20 fps), however fast samples arrive
+
+# Graph channels and their default line settings, index-aligned
+CHANNELS = ('RPM', 'Current', 'Distance', 'Motor Voltage', 'Bus Voltage', 'Input Power', 'Output Power')
+CHANNEL_INDEX = {name: i for i, name in enumerate(CHANNELS)}
+CHANNEL_COLORS = ('#1f77b4', '#ff7f0e', '#e377c2', '#2ca02c', '#8c564b', '#d62728', '#9467bd')
+CHANNEL_STYLES = ('-', '-', '-', '-', '-', '-', '-')
+CHANNEL_WIDTHS = (1.0, 1.0, 1.5, 0.5, 0.5, 0.5, 0.5)
+CHANNEL_DEFAULT_VISIBLE = (True, True, True, True, True, False, False)
+# Channel drawn from each data point field; the first three have a y-axis of their own in the line's color
+FIELD_CHANNELS = {'current': 'Current', 'rpm': 'RPM', 'distance': 'Distance',
+                  'voltage': 'Motor Voltage', 'bus_voltage': 'Bus Voltage',
+                  'input_power': 'Input Power', 'output_power': 'Output Power'}
+OWN_AXIS_FIELDS = frozenset({'current', 'rpm', 'distance'})
+
 # Configuration file for storing settings
 CONFIG_FILE = "motor_test_config.json"
 UPLOADED_TESTS_FILE = "uploaded_tests.json"
+# Last motor list fetched from the server, shown at startup until a fresh one arrives
+MOTORS_CACHE_FILE = "motors_cache.json"
+
+# Reuse a login this long before asking for a new token (the server's tokens last two hours)
+TOKEN_TTL_SECONDS = 3600
+
+# API requests ask for JSON; error replies are only read this far into the body
+JSON_HEADERS = {"Accept": "application/json"}
+JSON_BODY_HEADERS = {"Content-Type": "application/json"}
+GZIP_BODY_HEADERS = {"Content-Encoding": "gzip"}
+# 415 Unsupported Media Type: the server can't read a gzip body, so the upload is resent uncompressed
+GZIP_REJECTED_STATUS = 415
+ERROR_BODY_BYTES = 512
+
+SEASON_PATTERN = re.compile(
+    r'^(?:(?P<season>winter|spring|summer|fall)[\s,]+(?P<year>\d{4})'
+    r'|(?P<year2>\d{4})[\s,]+(?P<season2>winter|spring|summer|fall))$',
+    re.IGNORECASE
+)
+# Any other two-word input that contains a year, e.g. "March 2024"
+YEAR_WORD_PATTERN = re.compile(r'^(?:[^\s,]+[\s,]+(?P<year>\d{4})|(?P<year2>\d{4})[\s,]+[^\s,]+)$')
+DATE_PATTERN = re.compile(
+    r'^(?:(?P<year>\d{4})(?P<sep>[-/])(?P<month>\d{1,2})(?P=sep)(?P<day>\d{1,2})'
+    r'|(?P<us_month>\d{1,2})/(?P<us_day>\d{1,2})/(?P<us_year>\d{4}))$'
+)
+
+@lru_cache(maxsize=8)
+def build_login_url(server_url, username, password):
+    """Login URL with the credentials already query-encoded"""
+    return f"{server_url}/auth/login?" + urlencode({"username": username, "password": password})
+
+def sample_columns(data_points):
+    """Data points as a float64 array with one contiguous row per LIVE_FIELDS entry"""
+    columns = np.array(list(map(read_live_fields, data_points)), dtype=np.float64)
+    return np.ascontiguousarray(columns.T.reshape(len(LIVE_FIELDS), len(data_points)))
+
+def read_json_file(path):
+    """Load a JSON file, with orjson when it is installed"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def write_json_file(path, value):
+    """Write value as indented JSON, with orjson when it is installed"""
+    if orjson:
+        data = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(value, indent=2).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def json_body(value):
+    """Encode a request body as JSON bytes, with orjson when it is installed.
+    Dataclasses such as test data points are encoded as objects."""
+    if orjson:
+        return orjson.dumps(value)
+    return json.dumps(value, default=asdict).encode('utf-8')
+
+def response_json(response):
+    """Decode a JSON response body, with orjson when it is installed"""
+    return orjson.loads(response.content) if orjson else response.json()
+
+def read_error_body(response):
+    """Start of a streamed response body for error messages, without downloading the rest"""
+    chunk = next(response.iter_content(chunk_size=ERROR_BODY_BYTES), b'')
+    response.close()
+    return chunk.decode(response.encoding or 'utf-8', errors='replace')[:200]
 
 def parse_date_input(date_str):
     """
@@ -36,45 +145,42 @@ def parse_date_input(date_str):
     if date_str.lower() == 'unknown':
         return {}
     
-    # Try to parse as full date (YYYY-MM-DD or YYYY/MM/DD)
-    for fmt in ['%Y-%m-%d', '%Y/%m/%d']:
+    n = len(date_str)
+    
+    # Try just year (YYYY)
+    if n == 4 and date_str.isdigit():
+        return {'purchase_year': int(date_str)}
+    
+    # Already ISO (YYYY-MM-DD): validate and return it as typed
+    if n == 10 and date_str[4] == '-' and date_str[7] == '-':
         try:
-            from datetime import datetime
-            parsed = datetime.strptime(date_str, fmt)
-            return {'date_of_purchase': parsed.strftime('%Y-%m-%d')}
+            date.fromisoformat(date_str)
+            return {'date_of_purchase': date_str}
         except ValueError:
             pass
     
-    # Try MM/DD/YYYY
-    try:
-        from datetime import datetime
-        parsed = datetime.strptime(date_str, '%m/%d/%Y')
-        return {'date_of_purchase': parsed.strftime('%Y-%m-%d')}
-    except ValueError:
-        pass
-    
-    # Try just year (YYYY)
-    if date_str.isdigit() and len(date_str) == 4:
-        return {'purchase_year': int(date_str)}
+    # Full date: YYYY-MM-DD, YYYY/MM/DD or MM/DD/YYYY
+    match = DATE_PATTERN.match(date_str)
+    if match:
+        year = match['year'] or match['us_year']
+        month = match['month'] or match['us_month']
+        day = match['day'] or match['us_day']
+        try:
+            parsed = datetime(int(year), int(month), int(day))
+            return {'date_of_purchase': parsed.strftime('%Y-%m-%d')}
+        except ValueError:
+            pass
     
     # Try season + year (e.g., "Fall 2024" or "2024 Fall" or "Fall, 2024")
-    seasons = ['winter', 'spring', 'summer', 'fall']
-    parts = date_str.replace(',', ' ').split()
+    match = SEASON_PATTERN.match(date_str)
+    if match:
+        season = match['season'] or match['season2']
+        year = match['year'] or match['year2']
+        return {'purchase_season': season.capitalize(), 'purchase_year': int(year)}
     
-    if len(parts) == 2:
-        season = None
-        year = None
-        
-        for part in parts:
-            if part.lower() in seasons:
-                season = part.capitalize()
-            elif part.isdigit() and len(part) == 4:
-                year = int(part)
-        
-        if season and year:
-            return {'purchase_season': season, 'purchase_year': year}
-        elif year:  # Only year found
-            return {'purchase_year': year}
+    match = YEAR_WORD_PATTERN.match(date_str)
+    if match:  # Only year found
+        return {'purchase_year': int(match['year'] or match['year2'])}
     
     # If we can't parse it, return empty dict
     return {}
@@ -82,14 +188,17 @@ def parse_date_input(date_str):
 class AddMotorDialog(tk.Toplevel):
     """Dialog for adding a new motor to the system"""
     
+    WIDTH, HEIGHT = 550, 500  # Fixed size, so it can be centered without a layout pass
+    
     def __init__(self, parent):
         super().__init__(parent)
         self.title("Add New Motor")
-        self.geometry("550x500")
+        self.geometry(f"{self.WIDTH}x{self.HEIGHT}")
         self.resizable(False, False)
         
         self.result = None
         self.parent_app = parent
+        self.http = parent.http
         
         # Make dialog modal
         self.transient(parent)
@@ -98,9 +207,8 @@ class AddMotorDialog(tk.Toplevel):
         self._create_widgets()
         
         # Center on parent
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
+        x = parent.winfo_x() + (parent.winfo_width() - self.WIDTH) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - self.HEIGHT) // 2
         self.geometry(f"+{x}+{y}")
     
     def _create_widgets(self):
@@ -109,7 +217,7 @@ class AddMotorDialog(tk.Toplevel):
         main_frame.grid(row=0, column=0, sticky="nsew")
         
         # Type
-        ttk.Label(main_frame, text="Type:", font=('Segoe UI', 10)).grid(
+        ttk.Label(main_frame, text="Type:", font=self.parent_app.font_body).grid(
             row=0, column=0, sticky="w", pady=(0, 5)
         )
         self.type_var = tk.StringVar()
@@ -121,7 +229,7 @@ class AddMotorDialog(tk.Toplevel):
         type_combo.current(0)
         
         # Date of Purchase
-        ttk.Label(main_frame, text="Date of Purchase:", font=('Segoe UI', 10)).grid(
+        ttk.Label(main_frame, text="Date of Purchase:", font=self.parent_app.font_body).grid(
             row=2, column=0, sticky="w", pady=(0, 5)
         )
         self.date_var = tk.StringVar()
@@ -133,7 +241,7 @@ class AddMotorDialog(tk.Toplevel):
         )
         
         # Status
-        ttk.Label(main_frame, text="Status:", font=('Segoe UI', 10)).grid(
+        ttk.Label(main_frame, text="Status:", font=self.parent_app.font_body).grid(
             row=5, column=0, sticky="w", pady=(0, 5)
         )
         self.status_var = tk.StringVar()
@@ -144,7 +252,7 @@ class AddMotorDialog(tk.Toplevel):
         status_combo.current(0)
         
         # Nickname
-        ttk.Label(main_frame, text="Nickname (optional):", font=('Segoe UI', 10)).grid(
+        ttk.Label(main_frame, text="Nickname (optional):", font=self.parent_app.font_body).grid(
             row=7, column=0, sticky="w", pady=(0, 5)
         )
         self.nickname_var = tk.StringVar()
@@ -152,18 +260,19 @@ class AddMotorDialog(tk.Toplevel):
         nickname_entry.grid(row=8, column=0, sticky="ew", pady=(0, 15))
         
         # Initial Comments
-        ttk.Label(main_frame, text="Initial Comments (optional):", font=('Segoe UI', 10)).grid(
+        ttk.Label(main_frame, text="Initial Comments (optional):", font=self.parent_app.font_body).grid(
             row=9, column=0, sticky="w", pady=(0, 5)
         )
-        self.comments_text = tk.Text(main_frame, width=50, height=5, font=('Segoe UI', 10))
+        self.comments_text = tk.Text(main_frame, width=50, height=5, font=self.parent_app.font_body)
         self.comments_text.grid(row=10, column=0, sticky="ew", pady=(0, 20))
+        self.comments_text.edit_modified(False)
         
         # Buttons frame
         btn_frame = ttk.Frame(main_frame)
         btn_frame.grid(row=11, column=0, sticky="ew", pady=(0, 20))
         
-        submit_btn = ttk.Button(btn_frame, text="Submit", command=self._submit)
-        submit_btn.pack(side="left", padx=(0, 10))
+        self.submit_btn = ttk.Button(btn_frame, text="Submit", command=self._submit)
+        self.submit_btn.pack(side="left", padx=(0, 10))
         
         cancel_btn = ttk.Button(btn_frame, text="Cancel", command=self._cancel)
         cancel_btn.pack(side="left")
@@ -176,7 +285,8 @@ class AddMotorDialog(tk.Toplevel):
         date_input = self.date_var.get()
         status = self.status_var.get()
         nickname = self.nickname_var.get()
-        comments = self.comments_text.get("1.0", "end-1c")
+        # Only copy the text out of Tk if the user actually typed something
+        comments = self.comments_text.get("1.0", "end-1c") if self.comments_text.edit_modified() else ""
         
         if not motor_type or not status:
             messagebox.showwarning("Missing Information", 
@@ -187,28 +297,107 @@ class AddMotorDialog(tk.Toplevel):
         date_fields = parse_date_input(date_input)
         
         # Get server settings
-        if not self.parent_app.settings.get('server_url'):
+        settings = self.parent_app.settings
+        server_url = (settings.get('server_url') or '').rstrip('/')
+        username = settings.get('username')
+        password = settings.get('password')
+        
+        if not server_url:
             messagebox.showerror("No Server Configured",
                                "Please configure server settings first.")
             return
         
-        server_url = self.parent_app.settings.get('server_url').rstrip('/')
-        username = self.parent_app.settings.get('username')
-        password = self.parent_app.settings.get('password')
-        
         if not username or not password:
             messagebox.showerror("Missing Credentials",
                                "Please configure username and password in Setup.")
             return
         
+        # Create motor payload
+        motor_payload = {
+            "name": nickname if nickname else motor_type,
+            "motor_type": motor_type,
+            "status": status
+        }
+        
+        # Add date fields from parsed input
+        motor_payload.update(date_fields)
+        
+        # Talk to the server off the Tk thread so the window stays responsive
+        self.submit_btn.config(state="disabled")
+        future = self.parent_app.pool.submit(
+            self._submit_request, server_url, username, password, motor_payload, comments
+        )
+        future.add_done_callback(lambda f: self.after(0, self._submit_done, f, server_url))
+    
+    def _submit_request(self, server_url, username, password, motor_payload, comments):
+        """Log in, create the motor and add any comments (runs on the worker pool)"""
+        # Login to get token
+        login_url = build_login_url(server_url, username, password)
+        login_response = self.http.post(
+            login_url,
+            headers=JSON_HEADERS,
+            stream=True,
+            timeout=10
+        )
+        
+        token = None
+        if login_response.status_code == 200:
+            token = response_json(login_response).get('token')
+        else:
+            login_response.close()
+        if not token:
+            return login_response, None, None, None
+        
+        # Create motor on server
+        motors_url = f"{server_url}/motors"
+        headers = {**JSON_HEADERS, "Authorization": f"Bearer {token}"}
+        
+        create_response = self.http.post(
+            motors_url,
+            json=motor_payload,
+            headers=headers,
+            stream=True,
+            timeout=10
+        )
+        
+        if create_response.status_code != 200:
+            return login_response, create_response, None, read_error_body(create_response)
+        
+        created_motor = response_json(create_response)
+        
+        # If there are comments, add them as a log entry in the background so the dialog can close now
+        if comments and created_motor.get('motor_id'):
+            log_url = f"{server_url}/motors/{created_motor.get('id')}/logs"
+            log_payload = {
+                "entry_text": comments
+            }
+            self.parent_app.pool.submit(self._post_log, log_url, log_payload, headers)
+        
+        return login_response, create_response, created_motor, None
+    
+    def _post_log(self, log_url, log_payload, headers):
+        """Add the new motor's comments as a log entry (runs on the worker pool)"""
+        try:
+            response = self.http.post(log_url, json=log_payload, headers=headers, timeout=10)
+            if response.status_code == 200:
+                return
+            error = f"Status code: {response.status_code}"
+        except RequestException as e:
+            error = str(e)
+        print(f"Failed to add motor comments: {error}")
+        # The dialog has usually closed by now, so report through the main window
+        self.parent_app.after(0, lambda: messagebox.showwarning(
+            "Comments Not Saved",
+            f"The motor was created, but its comments could not be added.\n\n{error}"))
+    
+    def _submit_done(self, future, server_url):
+        """Show the outcome of a submit (runs on the Tk thread)"""
+        if not self.winfo_exists():
+            return
+        self.submit_btn.config(state="normal")
+        
         try:
-            # Login to get token
-            login_url = f"{server_url}/auth/login"
-            login_response = requests.post(
-                login_url,
-                params={"username": username, "password": password},
-                timeout=10
-            )
+            login_response, create_response, created_motor, error_body = future.result()
             
             if login_response.status_code != 200:
                 messagebox.showerror("Login Failed",
@@ -216,49 +405,14 @@ class AddMotorDialog(tk.Toplevel):
                                    f"Status code: {login_response.status_code}")
                 return
             
-            token_data = login_response.json()
-            token = token_data.get('token')
-            
-            if not token:
+            if create_response is None:
                 messagebox.showerror("Login Error",
                                    "Server did not return authentication token.")
                 return
             
-            # Create motor payload
-            motor_payload = {
-                "name": nickname if nickname else motor_type,
-                "motor_type": motor_type,
-                "status": status
-            }
-            
-            # Add date fields from parsed input
-            motor_payload.update(date_fields)
-            
-            # Create motor on server
-            motors_url = f"{server_url}/motors"
-            headers = {"Authorization": f"Bearer {token}"}
-            
-            create_response = requests.post(
-                motors_url,
-                json=motor_payload,
-                headers=headers,
-                timeout=10
-            )
-            
             if create_response.status_code == 200:
-                created_motor = create_response.json()
-                motor_id = created_motor.get('motor_id')
-                
-                # If there are comments, add them as a log entry
-                if comments and motor_id:
-                    log_url = f"{server_url}/motors/{created_motor.get('id')}/logs"
-                    log_payload = {
-                        "entry": comments
-                    }
-                    requests.post(log_url, json=log_payload, headers=headers, timeout=10)
-                
                 self.result = {
-                    'motor_id': motor_id,
+                    'motor_id': created_motor.get('motor_id'),
                     'motor_data': created_motor
                 }
                 
@@ -268,7 +422,7 @@ class AddMotorDialog(tk.Toplevel):
                 messagebox.showerror("Creation Failed",
                                    f"Failed to create motor.\n"
                                    f"Status code: {create_response.status_code}\n"
-                                   f"Response: {create_response.text[:200]}")
+                                   f"Response: {error_body}")
         
         except Timeout:
             messagebox.showerror("Timeout",
@@ -289,14 +443,18 @@ class AddMotorDialog(tk.Toplevel):
 class SettingsDialog(tk.Toplevel):
     """Dialog for configuring server connection settings"""
     
+    WIDTH, HEIGHT = 550, 650  # Fixed size, so it can be centered without a layout pass
+    
     def __init__(self, parent, current_settings):
         super().__init__(parent)
         self.title("Settings")
-        self.geometry("550x650")
+        self.geometry(f"{self.WIDTH}x{self.HEIGHT}")
         self.resizable(False, False)
         
         self.result = None
         self.current_settings = current_settings
+        self.parent_app = parent
+        self.http = parent.http
         
         # Make dialog modal
         self.transient(parent)
@@ -306,9 +464,8 @@ class SettingsDialog(tk.Toplevel):
         self._load_settings()
         
         # Center on parent
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
+        x = parent.winfo_x() + (parent.winfo_width() - self.WIDTH) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - self.HEIGHT) // 2
         self.geometry(f"+{x}+{y}")
     
     def _create_widgets(self):
@@ -317,7 +474,7 @@ class SettingsDialog(tk.Toplevel):
         main_frame.grid(row=0, column=0, sticky="nsew")
         
         # Server URL
-        ttk.Label(main_frame, text="Server URL:", font=('Segoe UI', 10)).grid(
+        ttk.Label(main_frame, text="Server URL:", font=self.parent_app.font_body).grid(
             row=0, column=0, sticky="w", pady=(0, 5)
         )
         self.url_var = tk.StringVar()
@@ -325,7 +482,7 @@ class SettingsDialog(tk.Toplevel):
         url_entry.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(0, 15))
         
         # Username
-        ttk.Label(main_frame, text="Username:", font=('Segoe UI', 10)).grid(
+        ttk.Label(main_frame, text="Username:", font=self.parent_app.font_body).grid(
             row=2, column=0, sticky="w", pady=(0, 5)
         )
         self.username_var = tk.StringVar()
@@ -333,7 +490,7 @@ class SettingsDialog(tk.Toplevel):
         username_entry.grid(row=3, column=0, columnspan=2, sticky="ew", pady=(0, 15))
         
         # Password
-        ttk.Label(main_frame, text="Password:", font=('Segoe UI', 10)).grid(
+        ttk.Label(main_frame, text="Password:", font=self.parent_app.font_body).grid(
             row=4, column=0, sticky="w", pady=(0, 5)
         )
         self.password_var = tk.StringVar()
@@ -342,7 +499,7 @@ class SettingsDialog(tk.Toplevel):
         password_entry.grid(row=5, column=0, columnspan=2, sticky="ew", pady=(0, 15))
         
         # Output Folder
-        ttk.Label(main_frame, text="Output Folder:", font=('Segoe UI', 10)).grid(
+        ttk.Label(main_frame, text="Output Folder:", font=self.parent_app.font_body).grid(
             row=6, column=0, sticky="w", pady=(0, 5)
         )
         folder_frame = ttk.Frame(main_frame)
@@ -357,7 +514,7 @@ class SettingsDialog(tk.Toplevel):
         ttk.Separator(main_frame, orient='horizontal').grid(
             row=8, column=0, columnspan=2, sticky="ew", pady=(0, 10)
         )
-        ttk.Label(main_frame, text="Weight Lift Test Hardware", font=('Segoe UI', 10, 'bold')).grid(
+        ttk.Label(main_frame, text="Weight Lift Test Hardware", font=self.parent_app.font_bold).grid(
             row=9, column=0, sticky="w", pady=(0, 10)
         )
         
@@ -365,11 +522,11 @@ class SettingsDialog(tk.Toplevel):
         row10_frame = ttk.Frame(main_frame)
         row10_frame.grid(row=10, column=0, columnspan=2, sticky="ew", pady=(0, 10))
         
-        ttk.Label(row10_frame, text="Gear Ratio:", font=('Segoe UI', 10)).pack(side=tk.LEFT)
+        ttk.Label(row10_frame, text="Gear Ratio:", font=self.parent_app.font_body).pack(side=tk.LEFT)
         self.gear_ratio_var = tk.StringVar()
         ttk.Entry(row10_frame, textvariable=self.gear_ratio_var, width=8).pack(side=tk.LEFT, padx=(5, 20))
         
-        ttk.Label(row10_frame, text="Spool Diameter (in):", font=('Segoe UI', 10)).pack(side=tk.LEFT)
+        ttk.Label(row10_frame, text="Spool Diameter (in):", font=self.parent_app.font_body).pack(side=tk.LEFT)
         self.spool_diameter_var = tk.StringVar()
         ttk.Entry(row10_frame, textvariable=self.spool_diameter_var, width=8).pack(side=tk.LEFT, padx=(5, 0))
         
@@ -377,11 +534,11 @@ class SettingsDialog(tk.Toplevel):
         row11_frame = ttk.Frame(main_frame)
         row11_frame.grid(row=11, column=0, columnspan=2, sticky="ew", pady=(0, 10))
         
-        ttk.Label(row11_frame, text="Weight (lbs):", font=('Segoe UI', 10)).pack(side=tk.LEFT)
+        ttk.Label(row11_frame, text="Weight (lbs):", font=self.parent_app.font_body).pack(side=tk.LEFT)
         self.weight_lbs_var = tk.StringVar()
         ttk.Entry(row11_frame, textvariable=self.weight_lbs_var, width=8).pack(side=tk.LEFT, padx=(5, 20))
         
-        ttk.Label(row11_frame, text="Max Lift Distance (in):", font=('Segoe UI', 10)).pack(side=tk.LEFT)
+        ttk.Label(row11_frame, text="Max Lift Distance (in):", font=self.parent_app.font_body).pack(side=tk.LEFT)
         self.max_lift_distance_var = tk.StringVar()
         ttk.Entry(row11_frame, textvariable=self.max_lift_distance_var, width=8).pack(side=tk.LEFT, padx=(5, 0))
         
@@ -389,12 +546,12 @@ class SettingsDialog(tk.Toplevel):
         self.lift_direction_cw_var = tk.BooleanVar(value=True)
         lift_dir_frame = ttk.Frame(main_frame)
         lift_dir_frame.grid(row=12, column=0, columnspan=2, sticky="w", pady=(0, 15))
-        ttk.Label(lift_dir_frame, text="Lift Direction:", font=('Segoe UI', 10)).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Label(lift_dir_frame, text="Lift Direction:", font=self.parent_app.font_body).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Radiobutton(lift_dir_frame, text="CW", variable=self.lift_direction_cw_var, value=True).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Radiobutton(lift_dir_frame, text="CCW", variable=self.lift_direction_cw_var, value=False).pack(side=tk.LEFT)
         
         # Hardware Description
-        ttk.Label(main_frame, text="Hardware Description:", font=('Segoe UI', 10)).grid(
+        ttk.Label(main_frame, text="Hardware Description:", font=self.parent_app.font_body).grid(
             row=13, column=0, sticky="w", pady=(0, 5)
         )
         self.hardware_desc_var = tk.StringVar()
@@ -405,9 +562,9 @@ class SettingsDialog(tk.Toplevel):
         btn_frame = ttk.Frame(main_frame)
         btn_frame.grid(row=15, column=0, columnspan=2, sticky="ew")
         
-        test_btn = ttk.Button(btn_frame, text="Test Connection", 
-                             command=self._test_connection)
-        test_btn.pack(side="left", padx=(0, 10))
+        self.test_btn = ttk.Button(btn_frame, text="Test Connection", 
+                                  command=self._test_connection)
+        self.test_btn.pack(side="left", padx=(0, 10))
         
         save_btn = ttk.Button(btn_frame, text="Save", command=self._save)
         save_btn.pack(side="left", padx=(0, 10))
@@ -451,18 +608,36 @@ class SettingsDialog(tk.Toplevel):
                                  "Please fill in all fields before testing.")
             return
         
+        # Attempt to login to verify credentials, off the Tk thread
+        login_url = build_login_url(url, username, password)
+        self.test_btn.config(state="disabled")
+        future = self.parent_app.pool.submit(self._test_connection_request, login_url)
+        future.add_done_callback(
+            lambda f: self.after(0, self._test_connection_done, f, url, username)
+        )
+    
+    def _test_connection_request(self, login_url):
+        """Log in and read the reply (runs on the worker pool)"""
+        response = self.http.post(
+            login_url,
+            headers=JSON_HEADERS,
+            stream=True,
+            timeout=10
+        )
+        if response.status_code == 200:
+            return response, response_json(response), None
+        return response, None, read_error_body(response)
+    
+    def _test_connection_done(self, future, url, username):
+        """Report the connection test result (runs on the Tk thread)"""
+        if not self.winfo_exists():
+            return
+        self.test_btn.config(state="normal")
+        
         try:
-            # Attempt to login to verify credentials
-            login_url = f"{url}/auth/login"
-            
-            response = requests.post(
-                login_url,
-                params={"username": username, "password": password},
-                timeout=10
-            )
+            response, data, error_body = future.result()
             
             if response.status_code == 200:
-                data = response.json()
                 if 'token' in data:
                     messagebox.showinfo(
                         "Connection Successful", 
@@ -485,7 +660,7 @@ class SettingsDialog(tk.Toplevel):
                 messagebox.showerror(
                     "Connection Failed",
                     f"Server returned error code: {response.status_code}\n\n"
-                    f"Response: {response.text[:200]}"
+                    f"Response: {error_body}"
                 )
         
         except Timeout:
@@ -517,48 +692,33 @@ class SettingsDialog(tk.Toplevel):
     def _save(self):
         """Save settings and close"""
         # Validate numeric fields
-        try:
-            gear_ratio = float(self.gear_ratio_var.get())
-            if gear_ratio <= 0:
-                raise ValueError()
-        except ValueError:
-            messagebox.showerror("Error", "Gear ratio must be a positive number")
-            return
-        
-        try:
-            spool_diameter = float(self.spool_diameter_var.get())
-            if spool_diameter <= 0:
-                raise ValueError()
-        except ValueError:
-            messagebox.showerror("Error", "Spool diameter must be a positive number")
-            return
-        
-        try:
-            weight_lbs = float(self.weight_lbs_var.get())
-            if weight_lbs <= 0:
-                raise ValueError()
-        except ValueError:
-            messagebox.showerror("Error", "Weight must be a positive number")
-            return
-        
-        try:
-            max_lift_distance = float(self.max_lift_distance_var.get())
-            if max_lift_distance <= 0:
-                raise ValueError()
-        except ValueError:
-            messagebox.showerror("Error", "Max lift distance must be a positive number")
-            return
+        numeric_fields = (
+            ('gear_ratio', self.gear_ratio_var, "Gear ratio"),
+            ('spool_diameter', self.spool_diameter_var, "Spool diameter"),
+            ('weight_lbs', self.weight_lbs_var, "Weight"),
+            ('max_lift_distance', self.max_lift_distance_var, "Max lift distance"),
+        )
+        parsed = {}
+        for name, var, label in numeric_fields:
+            try:
+                value = float(var.get())
+                if value <= 0:
+                    raise ValueError()
+            except ValueError:
+                messagebox.showerror("Error", f"{label} must be a positive number")
+                return
+            parsed[name] = value
         
         self.result = {
             'server_url': self.url_var.get(),
             'username': self.username_var.get(),
             'password': self.password_var.get(),
             'output_folder': self.output_folder_var.get(),
-            'gear_ratio': gear_ratio,
-            'spool_diameter': spool_diameter,
-            'weight_lbs': weight_lbs,
+            'gear_ratio': parsed['gear_ratio'],
+            'spool_diameter': parsed['spool_diameter'],
+            'weight_lbs': parsed['weight_lbs'],
             'lift_direction_cw': self.lift_direction_cw_var.get(),
-            'max_lift_distance': max_lift_distance,
+            'max_lift_distance': parsed['max_lift_distance'],
             'hardware_description': self.hardware_desc_var.get()
         }
         self.destroy()
@@ -580,27 +740,52 @@ class MotorTestApp(tk.Tk):
         
         # Application state
         self.settings = self._load_settings()
+        # One HTTP session for every server call so the connection is kept alive and reused
+        self.http = requests.Session()
+        # Room for the Tk thread plus both workers; no retries, failures go straight to the error dialogs
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        # Worker threads for dialog requests; results come back through self.after
+        self.pool = ThreadPoolExecutor(max_workers=2)
+        # Auth token from the last login, the credentials it belongs to and when to stop reusing it.
+        # Read and refreshed from both the Tk thread and the workers, always under auth_lock
+        self.auth_lock = threading.Lock()
+        self.auth_token = None
+        self.auth_token_key = None
+        self.auth_token_expiry = 0.0
+        self.gzip_uploads = True  # Cleared once the server turns down a compressed upload
         self.is_testing = False
         self.current_motor_info = None
         self.motors_cache = []
+        self.motors_by_id = {}  # motors_cache keyed by motor_id
+        self.sorted_motor_ids = []  # Combobox order, kept sorted as motors are added
+        self.motor_info_cache = {}  # motor_id -> (motor info, label text), reset on reload
+        self.motors_file_lock = threading.Lock()
         self.canivore_connected = False
         self.website_connected = False
         self.motor_connected = False
         self.test_results = None  # Store last test results
+        # Samples received so far during a running test, one row per LIVE_FIELDS entry
+        self.live_data = np.empty((len(LIVE_FIELDS), LIVE_PREALLOC), dtype=np.float64)
+        self.live_count = 0
+        self.result_columns = None  # sample_columns() of the finished test
+        self.pending_points = deque()  # Samples from the test thread not yet plotted
+        self.redraw_pending = False
+        self.graph_lines = []  # (Line2D, data point field) pairs of the current plot
+        self.graph_layout = None  # Visibility and scales the current axes were built for
+        self.graph_background = None  # Blit background of the live plot
+        self.graph_display_after_id = None  # Pending debounced _update_graph_display
         self.test_uuid = None  # UUID for current test
         self.test_max_rpm = 0
         self.test_max_amps = 0
+        self.test_max_lift_distance = self.settings.get('max_lift_distance', 18.0)
         
         # Graph display settings
-        self.graph_settings = {
-            'RPM': {'visible': tk.BooleanVar(value=True), 'color': '#1f77b4', 'style': '-', 'width': 1.0},
-            'Current': {'visible': tk.BooleanVar(value=True), 'color': '#ff7f0e', 'style': '-', 'width': 1.0},
-            'Distance': {'visible': tk.BooleanVar(value=True), 'color': '#e377c2', 'style': '-', 'width': 1.5},
-            'Motor Voltage': {'visible': tk.BooleanVar(value=True), 'color': '#2ca02c', 'style': '-', 'width': 0.5},
-            'Bus Voltage': {'visible': tk.BooleanVar(value=True), 'color': '#8c564b', 'style': '-', 'width': 0.5},
-            'Input Power': {'visible': tk.BooleanVar(value=False), 'color': '#d62728', 'style': '-', 'width': 0.5},
-            'Output Power': {'visible': tk.BooleanVar(value=False), 'color': '#9467bd', 'style': '-', 'width': 0.5}
-        }
+        self.channel_visible = [tk.BooleanVar(value=v) for v in CHANNEL_DEFAULT_VISIBLE]
+        self.channel_colors = list(CHANNEL_COLORS)
+        self.channel_styles = list(CHANNEL_STYLES)
+        self.channel_widths = list(CHANNEL_WIDTHS)
         
         # Motor test controller (will be recreated with device ID)
         self.motor_controller = None
@@ -609,6 +794,10 @@ class MotorTestApp(tk.Tk):
         self.style = ttk.Style()
         self.style.theme_use('vista')  # Modern Windows theme
         
+        # Shared font objects for the common label fonts, also used by the dialogs
+        self.font_body = tkfont.Font(family='Segoe UI', size=10)
+        self.font_bold = tkfont.Font(family='Segoe UI', size=10, weight='bold')
+        
         self._create_widgets()
         
         # Handle window close event
@@ -620,15 +809,15 @@ class MotorTestApp(tk.Tk):
         y = (self.winfo_screenheight() - self.winfo_height()) // 2
         self.geometry(f"+{x}+{y}")
         
-        # Load motors cache after window is displayed
+        # Show the saved motor list now, then refresh it from the server after the window is displayed
+        self._load_saved_motors()
         self.after_idle(self._load_motors_cache)
     
     def _load_settings(self):
         """Load settings from config file"""
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    return json.load(f)
+                return read_json_file(CONFIG_FILE)
             except:
                 pass
         return {
@@ -647,8 +836,11 @@ class MotorTestApp(tk.Tk):
     def _save_settings(self):
         """Save settings to config file"""
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            # Write to a temp file and swap it in so a crash mid-write can't
+            # leave a truncated config behind
+            temp_file = CONFIG_FILE + ".tmp"
+            write_json_file(temp_file, self.settings)
+            os.replace(temp_file, CONFIG_FILE)
         except Exception as e:
             print(f"Error saving settings: {e}")
     
@@ -683,16 +875,16 @@ class MotorTestApp(tk.Tk):
         status_frame.grid(row=0, column=0, sticky="ew", padx=5, pady=(5, 0))
         
         # CANivore status
-        ttk.Label(status_frame, text="CANivore:", font=('Segoe UI', 10, 'bold')).grid(
+        ttk.Label(status_frame, text="CANivore:", font=self.font_bold).grid(
             row=0, column=0, sticky="w", padx=(0, 10)
         )
         self.canivore_status_label = ttk.Label(status_frame, text="No Connection",
-                                               font=('Segoe UI', 10),
+                                               font=self.font_body,
                                                foreground='red')
         self.canivore_status_label.grid(row=0, column=1, sticky="w", padx=(0, 10))
         
         # Device ID field
-        ttk.Label(status_frame, text="Device ID:", font=('Segoe UI', 10)).grid(
+        ttk.Label(status_frame, text="Device ID:", font=self.font_body).grid(
             row=0, column=2, sticky="w", padx=(0, 5)
         )
         self.device_id_var = tk.StringVar(value="1")
@@ -708,28 +900,27 @@ class MotorTestApp(tk.Tk):
         self.canivore_connect_btn.grid(row=0, column=4, sticky="w", padx=(0, 10))
         
         # Motor status
-        ttk.Label(status_frame, text="Motor:", font=('Segoe UI', 10, 'bold')).grid(
+        ttk.Label(status_frame, text="Motor:", font=self.font_bold).grid(
             row=0, column=5, sticky="w", padx=(0, 10)
         )
         self.motor_status_label = ttk.Label(status_frame, text="No Motor Found",
-                                           font=('Segoe UI', 10),
+                                           font=self.font_body,
                                            foreground='red')
         self.motor_status_label.grid(row=0, column=6, sticky="w", padx=(0, 40))
         
         # Website status
-        ttk.Label(status_frame, text="Website:", font=('Segoe UI', 10, 'bold')).grid(
+        ttk.Label(status_frame, text="Website:", font=self.font_bold).grid(
             row=0, column=7, sticky="w", padx=(0, 10)
         )
         self.website_status_label = ttk.Label(status_frame, text="Off-Line",
-                                             font=('Segoe UI', 10),
+                                             font=self.font_body,
                                              foreground='red')
         self.website_status_label.grid(row=0, column=8, sticky="w")
         
         # Check initial status
         self._connect_hardware()
-        self._check_website_status()
         
-        # Start periodic website polling (every 30 seconds)
+        # Start periodic website polling (every 30 seconds); the first check runs now
         self._start_website_polling()    
     def _create_top_section(self, parent):
         """Create top input section with Motor ID and Max Amps"""
@@ -815,7 +1006,9 @@ class MotorTestApp(tk.Tk):
                                      state="disabled")
         self.save_csv_btn.pack(side=tk.RIGHT)
         
-        # Create matplotlib figure
+        # Create matplotlib figure (imported here, the only place it is needed)
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from matplotlib.figure import Figure
         self.fig = Figure(figsize=(9, 5), dpi=100)
         self.ax = self.fig.add_subplot(111)
         
@@ -829,13 +1022,15 @@ class MotorTestApp(tk.Tk):
         
         # Embed matplotlib figure in tkinter
         self.canvas = FigureCanvasTkAgg(self.fig, master=graph_container)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
         self.canvas.draw()
         
         # Add matplotlib navigation toolbar for zoom/pan/reset
-        toolbar_frame = ttk.Frame(graph_container)
-        toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
-        self.toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
+        self.toolbar_frame = ttk.Frame(graph_container)
+        self.toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        self.toolbar = NavigationToolbar2Tk(self.canvas, self.toolbar_frame)
         self.toolbar.update()
+        self.toolbar_shown = True  # Hidden while a test streams
         
         # Pack canvas after toolbar so toolbar appears at bottom
         self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
@@ -851,16 +1046,16 @@ class MotorTestApp(tk.Tk):
         controls_frame = ttk.LabelFrame(parent, text="Display Controls", padding="10")
         controls_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=(10, 0))
         
-        ttk.Label(controls_frame, text="Measurements:", font=('Segoe UI', 10, 'bold')).pack(anchor='w', pady=(0, 5))
+        ttk.Label(controls_frame, text="Measurements:", font=self.font_bold).pack(anchor='w', pady=(0, 5))
         
         # Create controls for each measurement
-        for idx, (name, settings) in enumerate(self.graph_settings.items()):
+        for idx, name in enumerate(CHANNELS):
             # Measurement frame
             meas_frame = ttk.Frame(controls_frame)
             meas_frame.pack(fill=tk.X, pady=5)
             
             # Checkbox for visibility
-            cb = ttk.Checkbutton(meas_frame, text=name, variable=settings['visible'],
+            cb = ttk.Checkbutton(meas_frame, text=name, variable=self.channel_visible[idx],
                                command=self._update_graph_display)
             cb.pack(anchor='w')
             
@@ -869,12 +1064,12 @@ class MotorTestApp(tk.Tk):
             style_frame.pack(fill=tk.X, padx=(20, 0))
             
             # Color picker button
-            color_btn = tk.Button(style_frame, bg=settings['color'], width=3, height=1,
+            color_btn = tk.Button(style_frame, bg=self.channel_colors[idx], width=3, height=1,
                                  command=lambda n=name: self._change_color(n))
             color_btn.pack(side=tk.LEFT, padx=(0, 5))
             
             # Line style dropdown
-            style_var = tk.StringVar(value='Solid' if settings['style'] == '-' else 'Dashed')
+            style_var = tk.StringVar(value='Solid' if self.channel_styles[idx] == '-' else 'Dashed')
             style_combo = ttk.Combobox(style_frame, textvariable=style_var,
                                       values=['Solid', 'Dashed'], width=8, state='readonly')
             style_combo.pack(side=tk.LEFT, padx=(0, 5))
@@ -885,7 +1080,7 @@ class MotorTestApp(tk.Tk):
             width_frame = ttk.Frame(style_frame)
             width_frame.pack(side=tk.LEFT)
             ttk.Label(width_frame, text="W:", font=('Segoe UI', 8)).pack(side=tk.LEFT)
-            width_var = tk.StringVar(value=str(settings['width']))
+            width_var = tk.StringVar(value=str(self.channel_widths[idx]))
             width_spin = ttk.Spinbox(width_frame, from_=0.5, to=5.0, increment=0.5,
                                     textvariable=width_var, width=5,
                                     command=lambda n=name, wv=width_var: self._change_width(n, wv.get()))
@@ -898,31 +1093,41 @@ class MotorTestApp(tk.Tk):
     def _change_color(self, measurement):
         """Change line color for a measurement"""
         from tkinter import colorchooser
-        color = colorchooser.askcolor(initialcolor=self.graph_settings[measurement]['color'],
+        color = colorchooser.askcolor(initialcolor=self.channel_colors[CHANNEL_INDEX[measurement]],
                                      title=f"Choose color for {measurement}")
         if color[1]:  # color[1] is hex string
-            self.graph_settings[measurement]['color'] = color[1]
-            self._update_graph_display()
+            self.channel_colors[CHANNEL_INDEX[measurement]] = color[1]
+            self._schedule_graph_display()
     
     def _change_style(self, measurement, style_name):
         """Change line style for a measurement"""
-        self.graph_settings[measurement]['style'] = '-' if style_name == 'Solid' else '--'
-        self._update_graph_display()
+        self.channel_styles[CHANNEL_INDEX[measurement]] = '-' if style_name == 'Solid' else '--'
+        self._schedule_graph_display()
     
     def _change_width(self, measurement, width_str):
         """Change line width for a measurement"""
         try:
             width = float(width_str)
-            self.graph_settings[measurement]['width'] = width
-            self._update_graph_display()
+            self.channel_widths[CHANNEL_INDEX[measurement]] = width
+            self._schedule_graph_display()
         except ValueError:
             pass
     
+    def _schedule_graph_display(self):
+        """Redraw with the new line settings once changes stop arriving (e.g. a held spinbox arrow)"""
+        if self.graph_display_after_id is not None:
+            self.after_cancel(self.graph_display_after_id)
+        self.graph_display_after_id = self.after(GRAPH_SETTINGS_REDRAW_MS, self._update_graph_display)
+    
     def _update_graph_display(self):
         """Redraw graph with current display settings"""
-        if self.test_results and self.test_results.data_points:
+        self.graph_display_after_id = None
+        if self.is_testing:
+            if self.live_count:
+                self._draw_graph(self.live_data[:, :self.live_count], is_final=False)
+        elif self.test_results and self.test_results.data_points:
             # Draw final graph with current settings
-            self._draw_graph(self.test_results.data_points, is_final=True)
+            self._draw_graph(self.result_columns, is_final=True)
     
     def _create_bottom_section(self, parent):
         """Create bottom section with START, STOP, UPLOAD buttons"""
@@ -1009,16 +1214,15 @@ class MotorTestApp(tk.Tk):
         self.wait_window(dialog)
         
         if dialog.result:
-            # Show hourglass cursor while refreshing
+            # Add the new motor right away; the reload below refreshes the rest of the list
+            self._add_motor_to_list(dialog.result['motor_data'])
+            
+            # Show hourglass cursor until the reload finishes
             self.config(cursor="wait")
-            self.update()
             
             # Reload motor cache from server
             self._load_motors_cache()
             
-            # Restore normal cursor
-            self.config(cursor="")
-            
             # Select the new motor in combobox
             motor_id = dialog.result.get('motor_id')
             if motor_id:
@@ -1026,50 +1230,123 @@ class MotorTestApp(tk.Tk):
                 # Trigger the selection event to display motor info
                 self._on_motor_selected()
     
+    def _get_token(self, server_url, username, password):
+        """Return (token, login_response), reusing the last token while it is fresh.
+        login_response is None when the cached token was used."""
+        key = (server_url, username, password)
+        # Held across the login so concurrent callers wait for one login and share its token
+        with self.auth_lock:
+            if self.auth_token and self.auth_token_key == key and time.monotonic() < self.auth_token_expiry:
+                return self.auth_token, None
+            
+            login_response = self.http.post(build_login_url(server_url, username, password), timeout=10)
+            token = response_json(login_response).get('token') if login_response.status_code == 200 else None
+            if token:
+                self.auth_token = token
+                self.auth_token_key = key
+                self.auth_token_expiry = time.monotonic() + TOKEN_TTL_SECONDS
+            return token, login_response
+    
+    def _drop_token(self, token):
+        """Forget a token the server rejected, unless another thread has already replaced it"""
+        with self.auth_lock:
+            if self.auth_token == token:
+                self.auth_token = None
+    
+    def _get_motors(self, server_url, username, password):
+        """GET /motors with a cached or fresh token. Returns (login_response, motors_response);
+        motors_response is None when logging in failed."""
+        token, login_response = self._get_token(server_url, username, password)
+        if not token:
+            return login_response, None
+        
+        motors_response = self.http.get(f"{server_url}/motors",
+                                        headers={"Authorization": f"Bearer {token}"},
+                                        timeout=10)
+        if motors_response.status_code == 401 and login_response is None:
+            # The cached token was rejected (e.g. the server's secret changed); log in again once
+            self._drop_token(token)
+            return self._get_motors(server_url, username, password)
+        return login_response, motors_response
+    
+    def _fetch_motors(self, server_url, username, password):
+        """Fetch the motor list (runs on the worker pool). Returns (login_response, motors_response,
+        motors); motors is None unless the list was retrieved."""
+        login_response, motors_response = self._get_motors(server_url, username, password)
+        motors = None
+        if motors_response is not None and motors_response.status_code == 200:
+            motors = response_json(motors_response)
+            self._save_motors_file(server_url, motors)
+        return login_response, motors_response, motors
+    
+    def _save_motors_file(self, server_url, motors):
+        """Keep the fetched motor list on disk for the next start (runs on the worker pool)"""
+        try:
+            with self.motors_file_lock:
+                temp_file = MOTORS_CACHE_FILE + ".tmp"
+                write_json_file(temp_file, {'server_url': server_url, 'motors': motors})
+                os.replace(temp_file, MOTORS_CACHE_FILE)
+        except OSError as e:
+            print(f"Error saving motor cache: {e}")
+    
+    def _load_saved_motors(self):
+        """Fill the motor list from the last fetch for this server, if one was saved"""
+        if not os.path.exists(MOTORS_CACHE_FILE):
+            return
+        try:
+            saved = read_json_file(MOTORS_CACHE_FILE)
+        except (OSError, ValueError) as e:
+            print(f"Error loading motor cache: {e}")
+            return
+        
+        # A corrupt or hand-edited cache is treated as empty; the server refresh replaces it
+        if not isinstance(saved, dict):
+            return
+        motors = saved.get('motors')
+        if not isinstance(motors, list) or not all(
+                isinstance(motor, dict) and isinstance(motor.get('motor_id', ''), str) for motor in motors):
+            return
+        
+        if saved.get('server_url') == (self.settings.get('server_url') or '').rstrip('/'):
+            self.motors_cache = motors
+            self._update_motor_id_list()
+    
     def _load_motors_cache(self):
         """Load all motors from server into cache"""
-        if not self.settings.get('server_url'):
+        server_url = (self.settings.get('server_url') or '').rstrip('/')
+        if not server_url:
             return
         
-        server_url = self.settings.get('server_url').rstrip('/')
         username = self.settings.get('username')
         password = self.settings.get('password')
         
         if not username or not password:
             return
         
+        # Get all motors (10 second timeouts) off the Tk thread
+        future = self.pool.submit(self._fetch_motors, server_url, username, password)
+        future.add_done_callback(lambda f: self.after(0, self._load_motors_cache_done, f, server_url))
+    
+    def _load_motors_cache_done(self, future, server_url):
+        """Store the fetched motor list or report why it failed (runs on the Tk thread)"""
+        self.config(cursor="")
+        
         try:
-            # Login to get token with 10 second timeout
-            login_url = f"{server_url}/auth/login"
-            login_response = requests.post(
-                login_url,
-                params={"username": username, "password": password},
-                timeout=10
-            )
+            login_response, motors_response, motors = future.result()
             
-            if login_response.status_code != 200:
-                messagebox.showerror("Connection Error",
-                                   f"Unable to connect to server.\n\n"
-                                   f"Server returned status code: {login_response.status_code}")
-                return
-            
-            token_data = login_response.json()
-            token = token_data.get('token')
-            
-            if not token:
-                messagebox.showerror("Connection Error",
-                                   "Unable to connect to server.\n\n"
-                                   "Server did not return authentication token.")
+            if motors_response is None:
+                if login_response.status_code != 200:
+                    messagebox.showerror("Connection Error",
+                                       f"Unable to connect to server.\n\n"
+                                       f"Server returned status code: {login_response.status_code}")
+                else:
+                    messagebox.showerror("Connection Error",
+                                       "Unable to connect to server.\n\n"
+                                       "Server did not return authentication token.")
                 return
             
-            # Get all motors with 10 second timeout
-            motors_url = f"{server_url}/motors"
-            headers = {"Authorization": f"Bearer {token}"}
-            
-            motors_response = requests.get(motors_url, headers=headers, timeout=10)
-            
-            if motors_response.status_code == 200:
-                self.motors_cache = motors_response.json()
+            if motors is not None:
+                self.motors_cache = motors
                 print(f"Loaded {len(self.motors_cache)} motors into cache")
                 self._update_motor_id_list()
             else:
@@ -1091,12 +1368,28 @@ class MotorTestApp(tk.Tk):
                                f"Error: {str(e)}")
     
     def _update_motor_id_list(self):
-        """Update the motor ID combobox with cached motor IDs"""
-        motor_ids = [motor.get('motor_id') for motor in self.motors_cache if motor.get('motor_id')]
-        motor_ids.sort()  # Sort alphabetically
+        """Index the cached motors by ID and update the motor ID combobox"""
+        self.motors_by_id = {motor['motor_id']: motor for motor in self.motors_cache if motor.get('motor_id')}
+        self.motor_info_cache = {}
+        self.sorted_motor_ids = sorted(self.motors_by_id)  # Sort alphabetically
+        self._set_motor_id_values()
+    
+    def _add_motor_to_list(self, motor):
+        """Add one new motor to the cache and combobox without re-sorting the rest"""
+        self.motors_cache.append(motor)
+        motor_id = motor.get('motor_id')
+        if not motor_id:
+            return
+        if motor_id not in self.motors_by_id:
+            bisect.insort(self.sorted_motor_ids, motor_id)
+        self.motors_by_id[motor_id] = motor
+        self.motor_info_cache.pop(motor_id, None)
+        self._set_motor_id_values()
+    
+    def _set_motor_id_values(self):
+        """Show the sorted motor IDs in the combobox"""
         # Add blank option at the top for running tests without specific motor
-        motor_ids.insert(0, '')
-        self.motor_id_combo['values'] = motor_ids
+        self.motor_id_combo['values'] = [''] + self.sorted_motor_ids
     
     def _on_motor_selected(self, event=None):
         """Handle motor selection from combobox"""
@@ -1108,48 +1401,56 @@ class MotorTestApp(tk.Tk):
             self.motor_info_label.config(text="No Motor Selected", foreground='#6c757d')
             return
         
-        # Look up motor in cache
-        motor_data = None
-        for motor in self.motors_cache:
-            if motor.get('motor_id') == motor_id:
-                motor_data = motor
-                break
+        self._show_motor_info(motor_id)
         
-        if motor_data:
-            # Display motor info
-            # Determine purchase date display
-            date_of_purchase = motor_data.get('date_of_purchase')
-            purchase_season = motor_data.get('purchase_season')
-            purchase_year = motor_data.get('purchase_year')
-            
-            if date_of_purchase:
-                date_display = str(date_of_purchase)
-            elif purchase_season and purchase_year:
-                date_display = f"{purchase_season} {purchase_year}"
-            elif purchase_year:
-                date_display = str(purchase_year)
-            else:
-                date_display = 'Unknown'
-            
-            self.current_motor_info = {
-                'type': motor_data.get('motor_type', 'Unknown'),
-                'date_purchase': date_display,
-                'nickname': motor_data.get('nickname', '') or motor_data.get('name', '')
-            }
-            
-            info_text = (f"Motor ID: {motor_id} | "
-                        f"Type: {self.current_motor_info['type']} | "
-                        f"Purchased: {self.current_motor_info['date_purchase']} | "
-                        f"Nickname: {self.current_motor_info['nickname']}")
-            
-            self.motor_info_label.config(text=info_text, foreground='#28a745')
+        # Update upload button state based on motor selection and test results
+        self._update_upload_button_state()
+    
+    def _format_motor_info(self, motor_id, motor_data):
+        """Return (motor info dict, label text) for a cached motor, memoized per motor ID"""
+        cached = self.motor_info_cache.get(motor_id)
+        if cached:
+            return cached
+        
+        # Determine purchase date display
+        date_of_purchase = motor_data.get('date_of_purchase')
+        purchase_season = motor_data.get('purchase_season')
+        purchase_year = motor_data.get('purchase_year')
+        
+        if date_of_purchase:
+            date_display = str(date_of_purchase)
+        elif purchase_season and purchase_year:
+            date_display = f"{purchase_season} {purchase_year}"
+        elif purchase_year:
+            date_display = str(purchase_year)
         else:
-            # Motor not in cache
+            date_display = 'Unknown'
+        
+        motor_info = {
+            'type': motor_data.get('motor_type', 'Unknown'),
+            'date_purchase': date_display,
+            'nickname': motor_data.get('nickname', '') or motor_data.get('name', '')
+        }
+        
+        info_text = (f"Motor ID: {motor_id} | "
+                    f"Type: {motor_info['type']} | "
+                    f"Purchased: {motor_info['date_purchase']} | "
+                    f"Nickname: {motor_info['nickname']}")
+        
+        self.motor_info_cache[motor_id] = (motor_info, info_text)
+        return motor_info, info_text
+    
+    def _show_motor_info(self, motor_id):
+        """Display the cached motor's info; returns False if the motor is not known"""
+        motor_data = self.motors_by_id.get(motor_id)
+        if not motor_data:
             self.current_motor_info = None
             self.motor_info_label.config(text="Motor Not Known", foreground='#dc3545')
+            return False
         
-        # Update upload button state based on motor selection and test results
-        self._update_upload_button_state()
+        self.current_motor_info, info_text = self._format_motor_info(motor_id, motor_data)
+        self.motor_info_label.config(text=info_text, foreground='#28a745')
+        return True
     
     def _update_upload_button_state(self):
         """Enable/disable upload button based on motor selection and test data"""
@@ -1164,13 +1465,13 @@ class MotorTestApp(tk.Tk):
     
     def _refresh_motor(self):
         """Refresh motor list from server and display selected motor"""
-        if not self.settings.get('server_url'):
+        server_url = (self.settings.get('server_url') or '').rstrip('/')
+        if not server_url:
             messagebox.showwarning("No Server Configured", 
                                  "Please configure server settings first.\n"
                                  "Click the Setup button.")
             return
         
-        server_url = self.settings.get('server_url').rstrip('/')
         username = self.settings.get('username')
         password = self.settings.get('password')
         
@@ -1179,35 +1480,25 @@ class MotorTestApp(tk.Tk):
                                  "Please configure username and password in Setup.")
             return
         
+        # Always reload motors from server, off the Tk thread
+        future = self.pool.submit(self._fetch_motors, server_url, username, password)
+        future.add_done_callback(lambda f: self.after(0, self._refresh_motor_done, f, server_url))
+    
+    def _refresh_motor_done(self, future, server_url):
+        """Update the motor list and selected motor info after a refresh (runs on the Tk thread)"""
         try:
-            # Login to get token
-            login_url = f"{server_url}/auth/login"
-            login_response = requests.post(
-                login_url,
-                params={"username": username, "password": password},
-                timeout=10
-            )
-            
-            if login_response.status_code != 200:
-                messagebox.showerror("Login Failed", 
-                                   f"Could not authenticate with server.\n"
-                                   f"Status code: {login_response.status_code}")
-                return
+            login_response, motors_response, motors = future.result()
             
-            token_data = login_response.json()
-            token = token_data.get('token')
-            
-            if not token:
-                messagebox.showerror("Login Error", 
-                                   "Server did not return authentication token.")
+            if motors_response is None:
+                if login_response.status_code != 200:
+                    messagebox.showerror("Login Failed", 
+                                       f"Could not authenticate with server.\n"
+                                       f"Status code: {login_response.status_code}")
+                else:
+                    messagebox.showerror("Login Error", 
+                                       "Server did not return authentication token.")
                 return
             
-            # Always reload motors from server
-            motors_url = f"{server_url}/motors"
-            headers = {"Authorization": f"Bearer {token}"}
-            
-            motors_response = requests.get(motors_url, headers=headers, timeout=10)
-            
             if motors_response.status_code != 200:
                 messagebox.showerror("Error", 
                                    f"Could not retrieve motors from server.\n"
@@ -1215,51 +1506,15 @@ class MotorTestApp(tk.Tk):
                 return
             
             # Update cache and combobox list
-            self.motors_cache = motors_response.json()
+            self.motors_cache = motors
             self._update_motor_id_list()
             
             # If a motor is selected, display its updated info
             motor_id = self.motor_id_var.get()
-            if motor_id:
-                motor_data = None
-                for motor in self.motors_cache:
-                    if motor.get('motor_id') == motor_id:
-                        motor_data = motor
-                        break
-                
-                if motor_data:
-                    # Determine purchase date display
-                    date_of_purchase = motor_data.get('date_of_purchase')
-                    purchase_season = motor_data.get('purchase_season')
-                    purchase_year = motor_data.get('purchase_year')
-                    
-                    if date_of_purchase:
-                        date_display = str(date_of_purchase)
-                    elif purchase_season and purchase_year:
-                        date_display = f"{purchase_season} {purchase_year}"
-                    elif purchase_year:
-                        date_display = str(purchase_year)
-                    else:
-                        date_display = 'Unknown'
-                    
-                    self.current_motor_info = {
-                        'type': motor_data.get('motor_type', 'Unknown'),
-                        'date_purchase': date_display,
-                        'nickname': motor_data.get('nickname', '') or motor_data.get('name', '')
-                    }
-                    
-                    info_text = (f"Motor ID: {motor_id} | "
-                                f"Type: {self.current_motor_info['type']} | "
-                                f"Purchased: {self.current_motor_info['date_purchase']} | "
-                                f"Nickname: {self.current_motor_info['nickname']}")
-                    
-                    self.motor_info_label.config(text=info_text, foreground='#28a745')
-                else:
-                    self.current_motor_info = None
-                    self.motor_info_label.config(text="Motor Not Known", foreground='#dc3545')
-                    messagebox.showerror("Motor Not Found", 
-                                       f"Motor ID '{motor_id}' does not exist in the database.\n\n"
-                                       f"Please check the ID or use 'Add Motor' to create it.")
+            if motor_id and not self._show_motor_info(motor_id):
+                messagebox.showerror("Motor Not Found", 
+                                   f"Motor ID '{motor_id}' does not exist in the database.\n\n"
+                                   f"Please check the ID or use 'Add Motor' to create it.")
         
         except Timeout:
             messagebox.showerror("Timeout", 
@@ -1289,11 +1544,17 @@ class MotorTestApp(tk.Tk):
         
         # Update UI state
         self.is_testing = True
+        self._set_toolbar_shown(False)
         self.start_btn.config(state="disabled", bg="#6c757d", cursor="")
         self.stop_btn.config(state="normal", bg="#dc3545", cursor="hand2")
         self.save_csv_btn.config(state="disabled", cursor="")
         self.upload_btn.config(state="disabled", cursor="")
         self.test_results = None
+        self.live_count = 0
+        self.result_columns = None
+        self.pending_points.clear()
+        self.graph_lines = []
+        self.graph_background = None
         self.test_uuid = str(uuid.uuid4())  # Generate unique UUID for this test
         print(f"Generated test UUID: {self.test_uuid}")
         self.avg_power_label.config(text="")  # Clear average power display
@@ -1302,6 +1563,7 @@ class MotorTestApp(tk.Tk):
         # Get weight lift settings for display
         max_lift_distance = self.settings.get('max_lift_distance', 18.0)
         weight_lbs = self.settings.get('weight_lbs', 5.0)
+        self.test_max_lift_distance = max_lift_distance  # Store for graph scaling
         
         # Clear the graph
         self.ax.clear()
@@ -1311,7 +1573,7 @@ class MotorTestApp(tk.Tk):
         self.ax.set_xlim(0, 30)  # 30 second time limit for weight lift
         self.ax.set_ylim(0, max_lift_distance * 1.1)  # 10% headroom on distance
         self.ax.grid(True, alpha=0.3)
-        self.canvas.draw()
+        self.canvas.draw_idle()
         
         # Display test info
         if motor_id:
@@ -1321,7 +1583,6 @@ class MotorTestApp(tk.Tk):
         print(f"  Max Distance: {max_lift_distance} inches")
         
         # Run the test in a separate thread to keep UI responsive
-        import threading
         test_thread = threading.Thread(
             target=self._run_test_thread,
             args=(motor_id, max_amps),
@@ -1352,31 +1613,104 @@ class MotorTestApp(tk.Tk):
     
     def _update_graph_callback(self, data_point):
         """Callback for real-time graph updates during test"""
-        # Schedule graph update on main thread
-        self.after(0, lambda: self._update_graph(data_point))
+        # Queue the sample; the main thread plots everything queued once per frame
+        self.pending_points.append(data_point)
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.after(LIVE_REDRAW_MS, self._update_graph)
     
-    def _update_graph(self, data_point):
-        """Update graph with new data point"""
+    def _update_graph(self):
+        """Update graph with the data points queued since the last frame"""
+        self.redraw_pending = False
         if not self.is_testing:
+            self.pending_points.clear()
+            return
+        
+        drawn_count = self.live_count
+        while self.pending_points:
+            data_point = self.pending_points.popleft()
+            if self.live_count == self.live_data.shape[1]:
+                self.live_data = np.concatenate((self.live_data, np.empty_like(self.live_data)), axis=1)
+            self.live_data[:, self.live_count] = read_live_fields(data_point)
+            self.live_count += 1
+        
+        if self.live_count == drawn_count:
+            # No new samples since the last frame; leave the lines' paths untouched
+            return
+        
+        if not self.graph_lines:
+            # First data point - lay out the axes and lines once
+            self._draw_graph(self.live_data[:, :self.live_count], is_final=False)
             return
         
-        # Collect all data points from test results
-        if self.test_results and self.test_results.data_points:
-            self._draw_graph(self.test_results.data_points, is_final=False)
+        # Reuse the existing lines; only their data changes between samples
+        times = self.live_data[LIVE_ROWS['timestamp'], :self.live_count]
+        for line, field in self.graph_lines:
+            line.set_data(times, self.live_data[LIVE_ROWS[field], :self.live_count])
+        
+        # Past the end of the time axis: widen it and let the next full draw re-capture the background
+        x_max = self.ax.get_xlim()[1]
+        if times[-1] > x_max:
+            self.ax.set_xlim(0, x_max + LIVE_XLIM_STEP)
+            self.graph_background = None
+        
+        if self.graph_background is None:
+            self.canvas.draw_idle()
+            return
+        
+        # Blit just the lines over the cached axes, ticks and grid
+        self.canvas.restore_region(self.graph_background)
+        self._draw_live_lines()
+        self.canvas.blit(self.ax.bbox)
+        self.canvas.flush_events()
+    
+    def _set_toolbar_shown(self, shown):
+        """Show or hide the navigation toolbar, whose mouse-move coordinate readout is hidden while a test streams"""
+        if shown == self.toolbar_shown:
+            return
+        if shown:
+            self.toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+            self.toolbar_frame.pack_propagate(True)
         else:
-            # First data point - initialize the graph
-            self.test_results = type('obj', (object,), {'data_points': [data_point]})
-    
-    def _draw_graph(self, data_points, is_final=False):
-        """Draw graph with specified data points and current display settings"""
-        times = [dp.timestamp for dp in data_points]
-        rpms = [dp.rpm for dp in data_points]
-        currents = [dp.current for dp in data_points]
-        voltages = [dp.voltage for dp in data_points]
-        bus_voltages = [dp.bus_voltage for dp in data_points]
-        input_powers = [dp.input_power for dp in data_points]
-        output_powers = [dp.output_power for dp in data_points]
-        distances = [dp.distance for dp in data_points]
+            # Keep the toolbar's row so the canvas isn't resized mid-test
+            self.toolbar_frame.config(height=self.toolbar_frame.winfo_height())
+            self.toolbar_frame.pack_propagate(False)
+            self.toolbar.pack_forget()
+        self.toolbar_shown = shown
+    
+    def _draw_live_lines(self):
+        """Draw the animated live lines onto the canvas"""
+        for line, _ in self.graph_lines:
+            line.axes.draw_artist(line)
+    
+    def _on_canvas_draw(self, event):
+        """Re-capture the blit background after every full redraw (layout, resize)"""
+        if self.is_testing and self.graph_lines:
+            self.graph_background = self.canvas.copy_from_bbox(self.ax.bbox)
+            self._draw_live_lines()
+    
+    def _draw_graph(self, columns, is_final=False):
+        """Draw graph from sample columns (rows in LIVE_FIELDS order) with current display settings"""
+        times = columns[LIVE_ROWS['timestamp']]
+        rpms = columns[LIVE_ROWS['rpm']]
+        currents = columns[LIVE_ROWS['current']]
+        voltages = columns[LIVE_ROWS['voltage']]
+        bus_voltages = columns[LIVE_ROWS['bus_voltage']]
+        input_powers = columns[LIVE_ROWS['input_power']]
+        output_powers = columns[LIVE_ROWS['output_power']]
+        distances = columns[LIVE_ROWS['distance']]
+        has_samples = len(times) > 0
+        
+        # Same axes as last time: update the existing lines instead of rebuilding the figure
+        visible = [var.get() for var in self.channel_visible]
+        layout = (tuple(visible), self.test_max_amps, self.test_max_rpm, self.test_max_lift_distance)
+        if self.graph_lines and layout == self.graph_layout:
+            self._restyle_graph(columns, is_final)
+            return
+        self.graph_layout = layout
+        
+        self.graph_lines = []
+        self.graph_background = None  # Re-captured when the new layout is drawn
         
         # Clear the main axis
         self.ax.clear()
@@ -1389,14 +1723,14 @@ class MotorTestApp(tk.Tk):
         self.fig.subplots_adjust(left=0.155, right=0.84)
         
         # Determine which axes are needed
-        show_current = self.graph_settings['Current']['visible'].get()
-        show_motor_voltage = self.graph_settings['Motor Voltage']['visible'].get()
-        show_bus_voltage = self.graph_settings['Bus Voltage']['visible'].get()
+        show_current = visible[CHANNEL_INDEX['Current']]
+        show_motor_voltage = visible[CHANNEL_INDEX['Motor Voltage']]
+        show_bus_voltage = visible[CHANNEL_INDEX['Bus Voltage']]
         show_voltage = show_motor_voltage or show_bus_voltage
-        show_rpm = self.graph_settings['RPM']['visible'].get()
-        show_distance = self.graph_settings['Distance']['visible'].get()
-        show_power = (self.graph_settings['Input Power']['visible'].get() or 
-                     self.graph_settings['Output Power']['visible'].get())
+        show_rpm = visible[CHANNEL_INDEX['RPM']]
+        show_distance = visible[CHANNEL_INDEX['Distance']]
+        show_power = (visible[CHANNEL_INDEX['Input Power']] or 
+                     visible[CHANNEL_INDEX['Output Power']])
         
         # Track active axes for positioning
         left_axes = []
@@ -1410,8 +1744,8 @@ class MotorTestApp(tk.Tk):
         ax_power = None
         
         # Set up scales
-        max_rpm = self.test_max_rpm * 1.1 if hasattr(self, 'test_max_rpm') and self.test_max_rpm > 0 else 6600
-        max_amps = self.test_max_amps * 1.1 if hasattr(self, 'test_max_amps') and self.test_max_amps > 0 else 44
+        max_rpm = self.test_max_rpm * 1.1 if self.test_max_rpm > 0 else 6600
+        max_amps = self.test_max_amps * 1.1 if self.test_max_amps > 0 else 44
         
         # Build left side axes (Current, Voltage)
         if show_current:
@@ -1419,14 +1753,15 @@ class MotorTestApp(tk.Tk):
             left_axes.append(ax_current)
             ax_current.set_ylim(0, max_amps)
             
-            settings = self.graph_settings['Current']
-            ax_current.plot(times, currents,
-                          color=settings['color'],
-                          linestyle=settings['style'],
-                          linewidth=settings['width'],
-                          label='Current (A)')
-            ax_current.set_ylabel('Current (A)', fontsize=10, color=settings['color'])
-            ax_current.tick_params(axis='y', labelcolor=settings['color'])
+            i = CHANNEL_INDEX['Current']
+            line, = ax_current.plot(times, currents,
+                                  color=self.channel_colors[i],
+                                  linestyle=self.channel_styles[i],
+                                  linewidth=self.channel_widths[i],
+                                  label='Current (A)')
+            self.graph_lines.append((line, 'current'))
+            ax_current.set_ylabel('Current (A)', fontsize=10, color=self.channel_colors[i])
+            ax_current.tick_params(axis='y', labelcolor=self.channel_colors[i])
         
         if show_voltage:
             if ax_current is None:
@@ -1443,22 +1778,24 @@ class MotorTestApp(tk.Tk):
             ax_voltage.set_ylim(0, 14)
             
             # Plot motor voltage if enabled
-            settings = self.graph_settings['Motor Voltage']
-            if settings['visible'].get():
-                ax_voltage.plot(times, voltages,
-                              color=settings['color'],
-                              linestyle=settings['style'],
-                              linewidth=settings['width'],
-                              label='Motor Voltage (V)')
+            i = CHANNEL_INDEX['Motor Voltage']
+            if visible[i]:
+                line, = ax_voltage.plot(times, voltages,
+                                      color=self.channel_colors[i],
+                                      linestyle=self.channel_styles[i],
+                                      linewidth=self.channel_widths[i],
+                                      label='Motor Voltage (V)')
+                self.graph_lines.append((line, 'voltage'))
             
             # Plot bus voltage if enabled
-            settings = self.graph_settings['Bus Voltage']
-            if settings['visible'].get():
-                ax_voltage.plot(times, bus_voltages,
-                              color=settings['color'],
-                              linestyle=settings['style'],
-                              linewidth=settings['width'],
-                              label='Bus Voltage (V)')
+            i = CHANNEL_INDEX['Bus Voltage']
+            if visible[i]:
+                line, = ax_voltage.plot(times, bus_voltages,
+                                      color=self.channel_colors[i],
+                                      linestyle=self.channel_styles[i],
+                                      linewidth=self.channel_widths[i],
+                                      label='Bus Voltage (V)')
+                self.graph_lines.append((line, 'bus_voltage'))
             
             ax_voltage.set_ylabel('Voltage (V)', fontsize=10, color='#2ca02c')
             ax_voltage.tick_params(axis='y', labelcolor='#2ca02c')
@@ -1472,14 +1809,15 @@ class MotorTestApp(tk.Tk):
             right_axes.append(ax_rpm)
             ax_rpm.set_ylim(0, max_rpm)
             
-            settings = self.graph_settings['RPM']
-            ax_rpm.plot(times, rpms,
-                       color=settings['color'],
-                       linestyle=settings['style'],
-                       linewidth=settings['width'],
-                       label='RPM')
-            ax_rpm.set_ylabel('RPM', fontsize=10, color=settings['color'])
-            ax_rpm.tick_params(axis='y', labelcolor=settings['color'])
+            i = CHANNEL_INDEX['RPM']
+            line, = ax_rpm.plot(times, rpms,
+                               color=self.channel_colors[i],
+                               linestyle=self.channel_styles[i],
+                               linewidth=self.channel_widths[i],
+                               label='RPM')
+            self.graph_lines.append((line, 'rpm'))
+            ax_rpm.set_ylabel('RPM', fontsize=10, color=self.channel_colors[i])
+            ax_rpm.tick_params(axis='y', labelcolor=self.channel_colors[i])
         
         if show_power:
             if not left_axes and not right_axes:
@@ -1494,21 +1832,23 @@ class MotorTestApp(tk.Tk):
             
             ax_power.set_ylim(0, 600)
             
-            settings_input = self.graph_settings['Input Power']
-            if settings_input['visible'].get():
-                ax_power.plot(times, input_powers,
-                            color=settings_input['color'],
-                            linestyle=settings_input['style'],
-                            linewidth=settings_input['width'],
-                            label='Input Power (W)')
-            
-            settings_output = self.graph_settings['Output Power']
-            if settings_output['visible'].get():
-                ax_power.plot(times, output_powers,
-                            color=settings_output['color'],
-                            linestyle=settings_output['style'],
-                            linewidth=settings_output['width'],
-                            label='Output Power (W)')
+            i = CHANNEL_INDEX['Input Power']
+            if visible[i]:
+                line, = ax_power.plot(times, input_powers,
+                                    color=self.channel_colors[i],
+                                    linestyle=self.channel_styles[i],
+                                    linewidth=self.channel_widths[i],
+                                    label='Input Power (W)')
+                self.graph_lines.append((line, 'input_power'))
+            
+            i = CHANNEL_INDEX['Output Power']
+            if visible[i]:
+                line, = ax_power.plot(times, output_powers,
+                                    color=self.channel_colors[i],
+                                    linestyle=self.channel_styles[i],
+                                    linewidth=self.channel_widths[i],
+                                    label='Output Power (W)')
+                self.graph_lines.append((line, 'output_power'))
             
             ax_power.set_ylabel('Power (W)', fontsize=10, color='#d62728')
             ax_power.tick_params(axis='y', labelcolor='#d62728')
@@ -1525,27 +1865,25 @@ class MotorTestApp(tk.Tk):
             if len(right_axes) > 1:
                 ax_distance.spines['right'].set_position(('outward', 60 * (len(right_axes) - 1)))
             
-            max_lift = self.settings.get('max_lift_distance', 18.0) * 1.1
+            max_lift = self.test_max_lift_distance * 1.1
             ax_distance.set_ylim(0, max_lift)
             
-            settings = self.graph_settings['Distance']
-            ax_distance.plot(times, distances,
-                           color=settings['color'],
-                           linestyle=settings['style'],
-                           linewidth=settings['width'],
-                           label='Distance (in)')
-            ax_distance.set_ylabel('Distance (in)', fontsize=10, color=settings['color'])
-            ax_distance.tick_params(axis='y', labelcolor=settings['color'])
+            i = CHANNEL_INDEX['Distance']
+            line, = ax_distance.plot(times, distances,
+                                   color=self.channel_colors[i],
+                                   linestyle=self.channel_styles[i],
+                                   linewidth=self.channel_widths[i],
+                                   label='Distance (in)')
+            self.graph_lines.append((line, 'distance'))
+            ax_distance.set_ylabel('Distance (in)', fontsize=10, color=self.channel_colors[i])
+            ax_distance.tick_params(axis='y', labelcolor=self.channel_colors[i])
         
         # Configure X axis on the primary axis
         self.ax.set_xlabel('Time (s)', fontsize=10)
         
         # Set X-axis limit based on whether test is complete
-        if is_final and data_points:
-            import math
-            last_time = data_points[-1].timestamp
-            max_time = math.ceil(last_time)  # Round up to nearest second
-            self.ax.set_xlim(0, max_time)
+        if is_final and has_samples:
+            self._show_final_view(times)
         else:
             self.ax.set_xlim(0, 10)  # Default 10 second time limit during test
         
@@ -1557,19 +1895,47 @@ class MotorTestApp(tk.Tk):
                         ha='center', va='center', transform=self.ax.transAxes,
                         fontsize=14, color='gray')
             self.ax.set_ylabel('')
-            
-        # Display calculated average power if test is complete
-        if is_final and data_points and hasattr(self, 'test_results'):
-            avg_power = getattr(self.test_results, 'avg_power', None)
-            if avg_power is not None:
-                title_text = f"Calculated Avg Power: {avg_power:.1f} W (4\"-12\")"
-                self.ax.set_title(title_text, fontsize=12, fontweight='bold', color='#333333')
         
-        self.canvas.draw()
+        # Live lines are left out of full draws and blitted on top instead
+        for line, _ in self.graph_lines:
+            line.set_animated(not is_final)
+        
+        self.canvas.draw_idle()
+    
+    def _show_final_view(self, times):
+        """Fit the time axis to the finished test and show its calculated average power"""
+        import math
+        max_time = math.ceil(times[-1])  # Round up to nearest second
+        self.ax.set_xlim(0, max_time)
+        
+        # Display calculated average power
+        avg_power = getattr(self.test_results, 'avg_power', None)
+        if avg_power is not None:
+            title_text = f"Calculated Avg Power: {avg_power:.1f} W (4\"-12\")"
+            self.ax.set_title(title_text, fontsize=12, fontweight='bold', color='#333333')
+    
+    def _restyle_graph(self, columns, is_final):
+        """Update the existing lines' data and styles in place, keeping the axes"""
+        times = columns[LIVE_ROWS['timestamp']]
+        for line, field in self.graph_lines:
+            i = CHANNEL_INDEX[FIELD_CHANNELS[field]]
+            line.set_data(times, columns[LIVE_ROWS[field]])
+            line.set(color=self.channel_colors[i], linestyle=self.channel_styles[i],
+                     linewidth=self.channel_widths[i], animated=not is_final)
+            if field in OWN_AXIS_FIELDS:
+                line.axes.yaxis.label.set_color(self.channel_colors[i])
+                line.axes.tick_params(axis='y', labelcolor=self.channel_colors[i])
+        
+        if is_final and len(times):
+            self._show_final_view(times)
+        
+        self.graph_background = None  # Re-captured when the figure is drawn
+        self.canvas.draw_idle()
     
     def _test_completed(self, result):
         """Handle test completion"""
         self.is_testing = False
+        self._set_toolbar_shown(True)
         self.start_btn.config(state="normal", bg="#28a745", cursor="hand2")
         self.stop_btn.config(state="disabled", bg="#8b4545", cursor="")
         
@@ -1580,12 +1946,15 @@ class MotorTestApp(tk.Tk):
         # Update upload button state based on data and motor selection
         self._update_upload_button_state()
         
+        if result.data_points:
+            self.result_columns = sample_columns(result.data_points)
+        
         # Calculate and display average power
         self._calculate_average_power(result)
         
         # Display final graph
         if result.data_points:
-            self._draw_graph(result.data_points, is_final=True)
+            self._draw_graph(self.result_columns, is_final=True)
         
         # Show completion message
         status = "Completed" if result.completed else "Timed Out"
@@ -1611,15 +1980,17 @@ class MotorTestApp(tk.Tk):
         target_rpm = self.test_target_rpm
         
         # Find the time and measured RPM when RPM goal was reached
-        delta_t = None
-        measured_rpm = None
-        for dp in result.data_points:
-            if dp.rpm >= target_rpm:
-                delta_t = dp.timestamp
-                measured_rpm = dp.rpm
-                break
+        rpms = self.result_columns[LIVE_ROWS['rpm']]
+        reached = rpms >= target_rpm
+        if not reached.any():
+            self.avg_power_label.config(text="")
+            self.calculated_avg_power = None
+            return
+        first = reached.argmax()
+        delta_t = self.result_columns[LIVE_ROWS['timestamp'], first]
+        measured_rpm = rpms[first]
         
-        if delta_t is None or delta_t <= 0 or measured_rpm is None:
+        if delta_t <= 0:
             self.avg_power_label.config(text="")
             self.calculated_avg_power = None
             return
@@ -1638,6 +2009,7 @@ class MotorTestApp(tk.Tk):
     def _test_error(self, error_msg):
         """Handle test error"""
         self.is_testing = False
+        self._set_toolbar_shown(True)
         self.start_btn.config(state="normal", bg="#28a745", cursor="hand2")
         self.stop_btn.config(state="disabled", bg="#8b4545", cursor="")
         messagebox.showerror("Test Error", error_msg)
@@ -1649,6 +2021,7 @@ class MotorTestApp(tk.Tk):
         
         # Update UI state
         self.is_testing = False
+        self._set_toolbar_shown(True)
         self.start_btn.config(state="normal", bg="#28a745", cursor="hand2")
         self.stop_btn.config(state="disabled", bg="#8b4545", cursor="")
     
@@ -1725,11 +2098,8 @@ class MotorTestApp(tk.Tk):
             import csv
             with open(filepath, 'w', newline='') as f:
                 writer = csv.writer(f)
-                # Write header
-                writer.writerow(['timestamp', 'voltage', 'bus_voltage', 'current', 'rpm', 'input_power', 'output_power'])
-                # Write data
-                for dp in self.test_results.data_points:
-                    writer.writerow([dp.timestamp, dp.voltage, dp.bus_voltage, dp.current, dp.rpm, dp.input_power, dp.output_power])
+                writer.writerow(CSV_FIELDS)
+                writer.writerows(map(read_csv_fields, self.test_results.data_points))
             
             messagebox.showinfo("Success", f"Test data saved to:\n{filepath}")
         except Exception as e:
@@ -1777,28 +2147,7 @@ class MotorTestApp(tk.Tk):
             return
         
         try:
-            # Authenticate and get token
-            auth_response = requests.post(
-                f"{server_url}/auth/login",
-                params={"username": username, "password": password},
-                timeout=10
-            )
-            
-            if auth_response.status_code != 200:
-                messagebox.showerror("Authentication Failed", 
-                                   f"Could not authenticate:\n{auth_response.text}")
-                return
-            
-            token = auth_response.json().get('token')
-            
-            if not token:
-                messagebox.showerror("Authentication Failed", 
-                                   "No token received from server")
-                return
-            
             # Prepare test data
-            from datetime import datetime
-            
             test_data = {
                 "test_uuid": self.test_uuid,
                 "test_date": datetime.now().isoformat(),
@@ -1813,22 +2162,9 @@ class MotorTestApp(tk.Tk):
                 "avg_power_10a": None,
                 "avg_power_20a": None,
                 "avg_power_40a": None,
-                "data_points": []
+                "data_points": self.test_results.data_points
             }
             
-            # Add data points
-            for dp in self.test_results.data_points:
-                test_data["data_points"].append({
-                    "timestamp": dp.timestamp,
-                    "voltage": dp.voltage,
-                    "bus_voltage": dp.bus_voltage,
-                    "current": dp.current,
-                    "rpm": dp.rpm,
-                    "distance": dp.distance,
-                    "input_power": dp.input_power,
-                    "output_power": dp.output_power
-                })
-            
             # Add average power for the current test
             max_current = int(self.max_amps_var.get())
             avg_power = self.test_results.avg_power  # Use avg_power from test result
@@ -1844,15 +2180,17 @@ class MotorTestApp(tk.Tk):
                     test_data["avg_power_40a"] = avg_power
             
             # Upload test data
-            headers = {"Authorization": f"Bearer {token}"}
-            upload_response = requests.post(
-                f"{server_url}/motors/{motor_id}/tests",
-                json=test_data,
-                headers=headers,
-                timeout=30
-            )
+            auth_response, upload_response = self._post_test(server_url, username, password,
+                                                             motor_id, json_body(test_data))
             
-            if upload_response.status_code == 200 or upload_response.status_code == 201:
+            if upload_response is None:
+                if auth_response.status_code != 200:
+                    messagebox.showerror("Authentication Failed", 
+                                       f"Could not authenticate:\n{auth_response.text}")
+                else:
+                    messagebox.showerror("Authentication Failed", 
+                                       "No token received from server")
+            elif upload_response.status_code == 200 or upload_response.status_code == 201:
                 # Mark test as uploaded
                 self._mark_test_uploaded(self.test_uuid)
                 
@@ -1882,12 +2220,37 @@ class MotorTestApp(tk.Tk):
             messagebox.showerror("Upload Failed", 
                                f"An error occurred:\n{str(e)}")
     
+    def _post_test(self, server_url, username, password, motor_id, body):
+        """POST an encoded test with a cached or fresh token. Returns (login_response, upload_response);
+        upload_response is None when logging in failed."""
+        token, login_response = self._get_token(server_url, username, password)
+        if not token:
+            return login_response, None
+        
+        upload_url = f"{server_url}/motors/{motor_id}/tests"
+        headers = {**JSON_BODY_HEADERS, "Authorization": f"Bearer {token}"}
+        upload_response = None
+        if self.gzip_uploads:
+            upload_response = self.http.post(upload_url, data=gzip.compress(body, compresslevel=1),
+                                             headers={**headers, **GZIP_BODY_HEADERS}, timeout=30)
+            if upload_response.status_code == GZIP_REJECTED_STATUS:
+                # The server doesn't decompress request bodies; send them plain from now on
+                self.gzip_uploads = False
+                upload_response = None
+        if upload_response is None:
+            upload_response = self.http.post(upload_url, data=body, headers=headers, timeout=30)
+        
+        if upload_response.status_code == 401 and login_response is None:
+            # The cached token was rejected; log in again once
+            self._drop_token(token)
+            return self._post_test(server_url, username, password, motor_id, body)
+        return login_response, upload_response
+    
     def _load_uploaded_tests(self):
         """Load the list of uploaded test UUIDs from file"""
         try:
             if os.path.exists(UPLOADED_TESTS_FILE):
-                with open(UPLOADED_TESTS_FILE, 'r') as f:
-                    return set(json.load(f))
+                return set(read_json_file(UPLOADED_TESTS_FILE))
             return set()
         except Exception as e:
             print(f"Error loading uploaded tests: {e}")
@@ -1896,8 +2259,7 @@ class MotorTestApp(tk.Tk):
     def _save_uploaded_tests(self, uploaded_tests):
         """Save the list of uploaded test UUIDs to file"""
         try:
-            with open(UPLOADED_TESTS_FILE, 'w') as f:
-                json.dump(list(uploaded_tests), f, indent=2)
+            write_json_file(UPLOADED_TESTS_FILE, list(uploaded_tests))
         except Exception as e:
             print(f"Error saving uploaded tests: {e}")
     
@@ -1926,6 +2288,8 @@ class MotorTestApp(tk.Tk):
             if not response:
                 return
         
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.http.close()
         self.destroy()
     
     def _connect_hardware(self):
@@ -2006,16 +2370,20 @@ class MotorTestApp(tk.Tk):
     
     def _check_website_status(self):
         """Check if website is accessible"""
-        if not self.settings.get('server_url'):
+        server_url = (self.settings.get('server_url') or '').rstrip('/')
+        if not server_url:
             self.website_connected = False
             self.website_status_label.config(text="Off-Line", foreground='#dc3545')
             return
         
-        server_url = self.settings.get('server_url').rstrip('/')
-        
+        # Quick ping to check if server is accessible, off the Tk thread
+        future = self.pool.submit(self.http.get, f"{server_url}/", timeout=3)
+        future.add_done_callback(lambda f: self.after(0, self._website_status_done, f))
+    
+    def _website_status_done(self, future):
+        """Show the result of a website ping (runs on the Tk thread)"""
         try:
-            # Quick ping to check if server is accessible
-            response = requests.get(f"{server_url}/", timeout=3)
+            response = future.result()
             self.website_connected = response.status_code == 200
             
             if self.website_connected:
@@ -0,0 +1,46 @@
+"""
+Migration script to add the indexes behind the motor log and performance
+test listings. Both endpoints filter by motor and page newest-first with a
+(timestamp, id) keyset cursor, which these composite indexes answer directly.
+"""
+
+import os
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+if not DATABASE_URL:
+    raise ValueError("DATABASE_URL environment variable is not set")
+
+engine = create_engine(DATABASE_URL)
+
+def migrate():
+    with engine.connect() as conn:
+        print("Starting migration to add listing indexes...")
+        
+        try:
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_motor_logs_motor_created
+                ON motor_logs (motor_id, created_at, id)
+            """))
+            print("✓ Created ix_motor_logs_motor_created index")
+            
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_performance_tests_motor_date
+                ON performance_tests (motor_id, test_date, id)
+            """))
+            print("✓ Created ix_performance_tests_motor_date index")
+            
+            conn.commit()
+            print("\n✅ Migration completed successfully!")
+            
+        except Exception as e:
+            print(f"\n❌ Migration failed: {e}")
+            conn.rollback()
+            raise
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,40 @@
+"""
+Migration script to add a prefix-search index on motors.motor_id.
+generate_motor_id filters with motor_id LIKE 'yyyy-%'; the varchar_pattern_ops
+index lets Postgres use a B-tree range scan for that regardless of collation.
+"""
+
+import os
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+if not DATABASE_URL:
+    raise ValueError("DATABASE_URL environment variable is not set")
+
+engine = create_engine(DATABASE_URL)
+
+def migrate():
+    with engine.connect() as conn:
+        print("Starting migration to add motor_id prefix index...")
+        
+        try:
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_motors_motor_id_pattern
+                ON motors (motor_id varchar_pattern_ops)
+            """))
+            print("✓ Created ix_motors_motor_id_pattern index")
+            
+            conn.commit()
+            print("\n✅ Migration completed successfully!")
+            
+        except Exception as e:
+            print(f"\n❌ Migration failed: {e}")
+            conn.rollback()
+            raise
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,59 @@
+"""
+Migration script to copy each performance test's avg_power values into its
+gzipped test data file. get_test_data now sends the stored file unchanged to
+clients that accept gzip, so older files need these fields written in.
+Run from the repository root so the data file paths resolve.
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+if not DATABASE_URL:
+    raise ValueError("DATABASE_URL environment variable is not set")
+
+engine = create_engine(DATABASE_URL)
+
+def migrate():
+    with engine.connect() as conn:
+        print("Starting migration to embed avg_power values in test data files...")
+
+        rows = conn.execute(text("""
+            SELECT data_file_path, avg_power_10a, avg_power_20a, avg_power_40a
+            FROM performance_tests
+            WHERE data_file_path IS NOT NULL
+        """)).all()
+
+        updated = 0
+        for row in rows:
+            data_file_path = Path("backend/app") / row.data_file_path.lstrip("/")
+            if not data_file_path.exists():
+                print(f"⚠ Missing file, skipped: {data_file_path}")
+                continue
+
+            with gzip.open(data_file_path, 'rt', encoding='utf-8') as f:
+                test_data = json.load(f)
+
+            if "avg_power_10a" in test_data:
+                continue
+
+            test_data['avg_power_10a'] = row.avg_power_10a
+            test_data['avg_power_20a'] = row.avg_power_20a
+            test_data['avg_power_40a'] = row.avg_power_40a
+
+            with gzip.open(data_file_path, 'wt', encoding='utf-8') as f:
+                json.dump(test_data, f)
+            updated += 1
+
+        print(f"✓ Updated {updated} of {len(rows)} test data files")
+        print("\n✅ Migration completed successfully!")
+
+if __name__ == "__main__":
+    migrate()
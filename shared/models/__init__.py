@@ -1,3 +1,3 @@
-from .models import Base, Motor, User, Run, Comment, MotorLog, PerformanceTest
+from .models import Base, Motor, MotorIdSequence, User, Run, Comment, MotorLog, PerformanceTest, pooled_uuid4
 
-__all__ = ["Base", "Motor", "User", "Run", "Comment", "MotorLog", "PerformanceTest"]
\ No newline at end of file
+__all__ = ["Base", "Motor", "MotorIdSequence", "User", "Run", "Comment", "MotorLog", "PerformanceTest", "pooled_uuid4"]
\ No newline at end of file
@@ -1,9 +1,25 @@
-from sqlalchemy import Column, String, Text, Float, TIMESTAMP, ForeignKey, UUID, func, Integer, Date
+from sqlalchemy import Column, String, Text, Float, TIMESTAMP, ForeignKey, UUID, func, Integer, Date, Index
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+import os
+import threading
 import uuid
 from typing import Optional
 from datetime import datetime
 
+# Random bytes are read in blocks and sliced into UUIDs, instead of one
+# os.urandom call per uuid4()
+UUID_POOL_BYTES = 4096
+_uuid_pool = threading.local()
+
+
+def pooled_uuid4() -> uuid.UUID:
+    """Random (version 4) UUID drawn from a per-thread pool of random bytes"""
+    pool = getattr(_uuid_pool, "buffer", b"")
+    if len(pool) < 16:
+        pool = os.urandom(UUID_POOL_BYTES)
+    _uuid_pool.buffer = pool[16:]
+    return uuid.UUID(bytes=pool[:16], version=4)
+
 
 class Base(DeclarativeBase):
     pass
@@ -11,8 +27,12 @@ class Base(DeclarativeBase):
 
 class Motor(Base):
     __tablename__ = "motors"
+    __table_args__ = (
+        # Lets "motor_id LIKE 'yyyy-%'" use a B-tree range scan under any collation
+        Index("ix_motors_motor_id_pattern", "motor_id", postgresql_ops={"motor_id": "varchar_pattern_ops"}),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=pooled_uuid4)
     motor_id: Mapped[Optional[str]] = mapped_column(String(20), unique=True)  # yyyy-nnn format
     name: Mapped[Optional[str]] = mapped_column(String(255))
     motor_type: Mapped[Optional[str]] = mapped_column(String(255))
@@ -37,10 +57,19 @@ class Motor(Base):
     performance_tests: Mapped[list["PerformanceTest"]] = relationship("PerformanceTest", back_populates="motor", cascade="all, delete-orphan")
 
 
+class MotorIdSequence(Base):
+    __tablename__ = "motor_id_sequences"
+
+    # Last motor_id sequence number handed out per year; the row lock taken
+    # when bumping it serializes concurrent motor creation
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_seq: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=pooled_uuid4)
     username: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[str] = mapped_column(String(50), server_default="user", nullable=False)
@@ -57,7 +86,7 @@ class User(Base):
 class Run(Base):
     __tablename__ = "runs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=pooled_uuid4)
     motor_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("motors.id"), nullable=False)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     timestamp: Mapped[TIMESTAMP] = mapped_column(TIMESTAMP, nullable=False)
@@ -77,7 +106,7 @@ class Run(Base):
 class Comment(Base):
     __tablename__ = "comments"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=pooled_uuid4)
     motor_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("motors.id"))
     run_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("runs.id"))
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -92,8 +121,12 @@ class Comment(Base):
 
 class MotorLog(Base):
     __tablename__ = "motor_logs"
+    __table_args__ = (
+        # Serves the newest-first, keyset-paginated log listing per motor
+        Index("ix_motor_logs_motor_created", "motor_id", "created_at", "id"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=pooled_uuid4)
     motor_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("motors.id"), nullable=False)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     entry_text: Mapped[str] = mapped_column(Text, nullable=False)
@@ -106,8 +139,12 @@ class MotorLog(Base):
 
 class PerformanceTest(Base):
     __tablename__ = "performance_tests"
+    __table_args__ = (
+        # Serves the newest-first, keyset-paginated test listing per motor
+        Index("ix_performance_tests_motor_date", "motor_id", "test_date", "id"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=pooled_uuid4)
     motor_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("motors.id"), nullable=False)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     test_uuid: Mapped[Optional[str]] = mapped_column(String(36), unique=True, index=True)  # Client-generated UUID for deduplication